@@ -0,0 +1,59 @@
+"""weather_cache.forecast_data: TEXT -> JSONB
+
+Revision ID: 2d88ccf00fc1
+Revises:
+Create Date: 2026-10-16 22:10:00.000000
+
+Databases created before the column became native JSON still hold
+forecast_data as TEXT, and reads from them return str instead of dicts.
+On PostgreSQL this casts the stored JSON text to JSONB in place. Other
+databases keep the JSON text as it is, which is how SQLAlchemy's generic
+JSON type stores it anyway.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d88ccf00fc1'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _forecast_data_type():
+    """Current type of weather_cache.forecast_data in the connected database"""
+    columns = sa.inspect(op.get_bind()).get_columns('weather_cache')
+    return next(column['type'] for column in columns if column['name'] == 'forecast_data')
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    # Tables created from the current models already use JSONB
+    if isinstance(_forecast_data_type(), postgresql.JSONB):
+        return
+    op.alter_column(
+        'weather_cache',
+        'forecast_data',
+        type_=postgresql.JSONB(),
+        existing_type=sa.Text(),
+        existing_nullable=False,
+        postgresql_using='forecast_data::jsonb',
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column(
+        'weather_cache',
+        'forecast_data',
+        type_=sa.Text(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=False,
+        postgresql_using='forecast_data::text',
+    )
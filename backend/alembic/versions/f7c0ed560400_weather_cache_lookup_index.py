@@ -0,0 +1,44 @@
+"""weather_cache: replace idx_taluka_expires with idx_taluka_cached_expires
+
+Revision ID: f7c0ed560400
+Revises: 2d88ccf00fc1
+Create Date: 2026-10-16 22:15:00.000000
+
+The cache lookup asks for the newest unexpired row per taluka, which
+(taluka, cached_at DESC, expires_at) serves directly. The old
+(taluka, expires_at) index is superseded by it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c0ed560400'
+down_revision: Union[str, None] = '2d88ccf00fc1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _index_names():
+    """Names of the indexes currently on weather_cache"""
+    return {index['name'] for index in sa.inspect(op.get_bind()).get_indexes('weather_cache')}
+
+
+def upgrade() -> None:
+    existing = _index_names()
+    # Tables created from the current models already have the new index
+    if 'idx_taluka_cached_expires' not in existing:
+        op.create_index(
+            'idx_taluka_cached_expires',
+            'weather_cache',
+            ['taluka', sa.text('cached_at DESC'), 'expires_at'],
+        )
+    if 'idx_taluka_expires' in existing:
+        op.drop_index('idx_taluka_expires', table_name='weather_cache')
+
+
+def downgrade() -> None:
+    op.create_index('idx_taluka_expires', 'weather_cache', ['taluka', 'expires_at'])
+    op.drop_index('idx_taluka_cached_expires', table_name='weather_cache')
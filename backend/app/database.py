@@ -9,6 +9,8 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool, NullPool
 from sqlalchemy.engine import Engine
+import orjson
+
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -30,6 +32,10 @@ _engine_kwargs: dict = dict(
     pool_pre_ping=pool_pre_ping,
     echo=settings.DEBUG,
     connect_args=connect_args,
+    # JSON/JSONB columns (the weather forecast cache) are encoded and decoded
+    # with orjson; the drivers expect a str to bind.
+    json_serializer=lambda value: orjson.dumps(value).decode("utf-8"),
+    json_deserializer=orjson.loads,
 )
 
 if poolclass is not NullPool:
@@ -9,11 +9,12 @@ import logging
 import logging.handlers
 import sys
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 
 from app.config import settings
 from app.database import check_db_connection, init_db, get_db_context
@@ -23,13 +24,14 @@ from app.middleware.logging_middleware import RequestLoggingMiddleware
 from app.middleware.rate_limiter import RateLimitMiddleware
 from app.middleware.request_id import RequestIDMiddleware
 from app.routes import disease, weather, apmc, schemes, voice, auth
+from app.services.weather_service import close_http_client as close_weather_client
 from app.utils.constants import (
     API_LEGACY_PREFIX,
     API_V1_PREFIX,
     HEALTH_STATUS_DEGRADED,
     HEALTH_STATUS_HEALTHY,
 )
-from app.utils.helpers import utc_now, format_iso
+from app.utils.helpers import dump_json_bytes, utc_now, format_iso
 
 
 # ---------------------------------------------------------------------------
@@ -151,6 +153,7 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    await close_weather_client()
     logger.info("Farm Help API shutting down")
 
 
@@ -169,6 +172,8 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    # Encode route responses with orjson
+    default_response_class=ORJSONResponse,
 )
 
 # ---------------------------------------------------------------------------
@@ -242,27 +247,15 @@ async def root():
     }
 
 
-@app.get("/health", tags=["System"])
-async def health_check(request: Request):
-    """
-    Health check endpoint with component-level status.
-
-    Returns database connectivity status, uptime metadata,
-    and the current request ID for traceability.
-    """
-    db_connected = check_db_connection()
-    overall = HEALTH_STATUS_HEALTHY if db_connected else HEALTH_STATUS_DEGRADED
-
-    request_id = getattr(request.state, "request_id", None)
-
+def _health_body(db_connected: bool, timestamp: str, request_id) -> dict:
+    """Build the /health payload for the given database state."""
     db_label = "connected" if db_connected else "disconnected"
-
     return {
-        "status": overall,
+        "status": HEALTH_STATUS_HEALTHY if db_connected else HEALTH_STATUS_DEGRADED,
         "service": settings.APP_NAME,
         "version": settings.APP_VERSION,
         "environment": settings.ENVIRONMENT,
-        "timestamp": format_iso(utc_now()),
+        "timestamp": timestamp,
         "request_id": request_id,
         "database": db_label,
         "components": {
@@ -276,6 +269,45 @@ async def health_check(request: Request):
     }
 
 
+# Placeholders in the pre-rendered healthy body for the per-request fields
+_HEALTH_TIMESTAMP_SLOT = "__HEALTH_TIMESTAMP__"
+_HEALTH_REQUEST_ID_SLOT = "__HEALTH_REQUEST_ID__"
+
+
+@lru_cache(maxsize=1)
+def _healthy_template() -> bytes:
+    """Render the healthy /health body once, with placeholder strings."""
+    return dump_json_bytes(
+        _health_body(True, _HEALTH_TIMESTAMP_SLOT, _HEALTH_REQUEST_ID_SLOT)
+    )
+
+
+@app.get("/health", tags=["System"])
+async def health_check(request: Request):
+    """
+    Health check endpoint with component-level status.
+
+    Returns database connectivity status, uptime metadata,
+    and the current request ID for traceability.
+    """
+    db_connected = check_db_connection()
+    timestamp = format_iso(utc_now())
+    request_id = getattr(request.state, "request_id", None)
+
+    if not db_connected:
+        return _health_body(False, timestamp, request_id)
+
+    # Liveness probes hit the healthy path; splice the two per-request
+    # values into the pre-rendered body instead of re-encoding it. Each is
+    # JSON-encoded on its own, so a client-supplied request ID stays escaped.
+    body = (
+        _healthy_template()
+        .replace(dump_json_bytes(_HEALTH_TIMESTAMP_SLOT), dump_json_bytes(timestamp), 1)
+        .replace(dump_json_bytes(_HEALTH_REQUEST_ID_SLOT), dump_json_bytes(request_id), 1)
+    )
+    return Response(content=body, media_type="application/json")
+
+
 # ---------------------------------------------------------------------------
 # Static files and SPA fallback (production / Hugging Face)
 # ---------------------------------------------------------------------------
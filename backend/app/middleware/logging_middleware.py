@@ -23,13 +23,19 @@ from starlette.responses import Response
 logger = logging.getLogger("farmhelp.access")
 
 
+def _elapsed_ms(start_ns: int) -> str:
+    """Milliseconds since ``start_ns`` as a fixed two-decimal string."""
+    hundredths = (time.perf_counter_ns() - start_ns) // 10_000
+    return f"{hundredths // 100}.{hundredths % 100:02d}"
+
+
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """Structured access logging for every request/response."""
 
     async def dispatch(
         self, request: Request, call_next: RequestResponseEndpoint
     ) -> Response:
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
 
         request_id = getattr(request.state, "request_id", "-")
         client_ip = request.client.host if request.client else "unknown"
@@ -49,7 +55,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         try:
             response = await call_next(request)
         except Exception:
-            elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
+            elapsed_ms = _elapsed_ms(start)
             logger.exception(
                 "request_error | request_id=%s method=%s path=%s time_ms=%s",
                 request_id,
@@ -59,7 +65,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             )
             raise
 
-        elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
+        elapsed_ms = _elapsed_ms(start)
         status_code = response.status_code
 
         log_msg = (
@@ -75,5 +81,5 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         else:
             logger.info(log_msg, *log_args)
 
-        response.headers["X-Response-Time-Ms"] = str(elapsed_ms)
+        response.headers["X-Response-Time-Ms"] = elapsed_ms
         return response
@@ -6,7 +6,8 @@ Models are defined using SQLAlchemy ORM with proper relationships,
 indexes, and constraints for optimal performance.
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Index, CheckConstraint
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, JSON, Index, CheckConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -50,12 +51,15 @@ class WeatherCache(Base):
     taluka = Column(String(100), nullable=False, index=True)
     latitude = Column(Float, nullable=False)
     longitude = Column(Float, nullable=False)
-    forecast_data = Column(Text, nullable=False)
+    # Native JSONB on PostgreSQL; generic JSON (TEXT-backed) elsewhere
+    forecast_data = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
     cached_at = Column(DateTime(timezone=True), server_default=func.now())
     expires_at = Column(DateTime(timezone=True), nullable=False)
 
     __table_args__ = (
-        Index('idx_taluka_expires', 'taluka', 'expires_at'),
+        # Serves the cache lookup: newest unexpired row per taluka
+        # (equality on taluka, backward scan on cached_at, filter on expires_at).
+        Index('idx_taluka_cached_expires', taluka, cached_at.desc(), expires_at),
         Index('idx_expires_at', 'expires_at'),
         CheckConstraint('latitude >= -90 AND latitude <= 90', name='check_latitude_range'),
         CheckConstraint('longitude >= -180 AND longitude <= 180', name='check_longitude_range'),
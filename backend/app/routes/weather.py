@@ -11,9 +11,10 @@ Endpoints:
 
 import logging
 import time
+from functools import lru_cache
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -26,6 +27,7 @@ from app.services.weather_service import (
     get_forecast,
     get_location_hierarchy,
 )
+from app.utils.helpers import dump_json_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -293,18 +295,14 @@ async def analyze_weather(
     return result
 
 
-# ---------------------------------------------------------------------------
-# GET /api/weather/crops
-# ---------------------------------------------------------------------------
-@router.get(
-    "/crops",
-    summary="List supported crop types for weather analysis",
-    description=(
-        "Returns the list of crop types supported by the weather analysis "
-        "endpoint, along with their optimal growing conditions."
-    ),
-)
-async def list_supported_crops():
+@lru_cache(maxsize=1)
+def _crops_payload() -> bytes:
+    """
+    Serialise the supported-crops catalogue once.
+
+    Crop profiles are static for the life of the process, so the JSON
+    body is built on first request and reused.
+    """
     profiles = _ensure_profiles_loaded()
     crops = []
     for name, profile in sorted(profiles.items()):
@@ -322,4 +320,19 @@ async def list_supported_crops():
                 "harvest_months": profile.get("harvest_months", []),
             }
         )
-    return {"total": len(crops), "crops": crops}
+    return dump_json_bytes({"total": len(crops), "crops": crops})
+
+
+# ---------------------------------------------------------------------------
+# GET /api/weather/crops
+# ---------------------------------------------------------------------------
+@router.get(
+    "/crops",
+    summary="List supported crop types for weather analysis",
+    description=(
+        "Returns the list of crop types supported by the weather analysis "
+        "endpoint, along with their optimal growing conditions."
+    ),
+)
+async def list_supported_crops():
+    return Response(content=_crops_payload(), media_type="application/json")
@@ -16,12 +16,13 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from app.database import SessionLocal, init_db
 from app.models import MandiPrice
+from app.utils.helpers import parse_iso_datetime
 
 
 def parse_date(date_str: str) -> datetime:
     """Parse date string to datetime object."""
     try:
-        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        return parse_iso_datetime(date_str)
     except Exception:
         return datetime.now()
 
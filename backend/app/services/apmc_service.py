@@ -17,6 +17,7 @@ from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.models import MandiPrice
+from app.utils.helpers import haversine_distances_prepared, prepare_point
 
 logger = logging.getLogger(__name__)
 
@@ -28,9 +29,6 @@ logger = logging.getLogger(__name__)
 DATA_GOV_RESOURCE_ID = "9ef84268-d588-465a-a308-a864a43d0070"
 API_TIMEOUT_SECONDS = 45.0
 
-# Earth radius in kilometers (WGS-84 mean)
-EARTH_RADIUS_KM = 6371.0
-
 # Transport cost estimate: INR per km per quintal
 TRANSPORT_COST_PER_KM_PER_QUINTAL = 2.5
 
@@ -88,31 +86,11 @@ APMC_COORDINATES: Dict[str, Dict[str, float]] = {
     "Shamli Mandi": {"lat": 29.4527, "lon": 77.3099},
 }
 
-
-# ---------------------------------------------------------------------------
-# Distance Calculation (Haversine)
-# ---------------------------------------------------------------------------
-
-def haversine_distance(
-    lat1: float, lon1: float, lat2: float, lon2: float
-) -> float:
-    """
-    Calculate the great-circle distance between two points
-    on Earth using the Haversine formula.
-
-    Returns:
-        Distance in kilometers.
-    """
-    d_lat = math.radians(lat2 - lat1)
-    d_lon = math.radians(lon2 - lon1)
-    a = (
-        math.sin(d_lat / 2) ** 2
-        + math.cos(math.radians(lat1))
-        * math.cos(math.radians(lat2))
-        * math.sin(d_lon / 2) ** 2
-    )
-    c = 2 * math.asin(math.sqrt(a))
-    return EARTH_RADIUS_KM * c
+# Radians/cosine of each APMC location, converted once for distance ranking
+_APMC_PREPARED_POINTS = {
+    name: prepare_point(coord["lat"], coord["lon"])
+    for name, coord in APMC_COORDINATES.items()
+}
 
 
 # ---------------------------------------------------------------------------
@@ -659,9 +637,31 @@ def find_best_apmc(
         base_query.with_entities(MandiPrice.mandi_name).distinct().all()
     )
 
+    candidates: List[Tuple[str, Optional[float]]]
+    if user_lat is not None and user_lon is not None:
+        # No coordinates for an APMC means it is skipped when distance
+        # filtering is active, to avoid unfair ranking. Distances are
+        # computed in one batch and out-of-range APMCs are dropped before
+        # querying their latest price.
+        located = [
+            (name, _APMC_PREPARED_POINTS[name])
+            for (name,) in distinct_mandis
+            if name in _APMC_PREPARED_POINTS
+        ]
+        distances = haversine_distances_prepared(
+            user_lat, user_lon, (point for _, point in located)
+        )
+        candidates = []
+        for (name, _), distance in zip(located, distances):
+            distance_km = round(distance, 1)
+            if distance_km <= max_distance_km:
+                candidates.append((name, distance_km))
+    else:
+        candidates = [(name, None) for (name,) in distinct_mandis]
+
     recommendations: List[Dict[str, Any]] = []
 
-    for (mandi_name,) in distinct_mandis:
+    for mandi_name, distance_km in candidates:
         latest = (
             db.query(MandiPrice)
             .filter(
@@ -674,30 +674,11 @@ def find_best_apmc(
         if not latest:
             continue
 
-        distance_km: Optional[float] = None
         transport_cost = 0.0
-        apmc_coord = APMC_COORDINATES.get(mandi_name)
-
-        if user_lat is not None and user_lon is not None:
-            if apmc_coord:
-                distance_km = round(
-                    haversine_distance(
-                        user_lat,
-                        user_lon,
-                        apmc_coord["lat"],
-                        apmc_coord["lon"],
-                    ),
-                    1,
-                )
-                if distance_km > max_distance_km:
-                    continue
-                transport_cost = round(
-                    distance_km * TRANSPORT_COST_PER_KM_PER_QUINTAL, 2
-                )
-            else:
-                # No coordinates for this APMC; skip when distance
-                # filtering is active to avoid unfair ranking.
-                continue
+        if distance_km is not None:
+            transport_cost = round(
+                distance_km * TRANSPORT_COST_PER_KM_PER_QUINTAL, 2
+            )
 
         net_price = round(latest.price_per_quintal - transport_cost, 2)
 
@@ -793,7 +774,7 @@ def get_price_trends(
     daily: Dict[str, List[float]] = {}
     for p in prices:
         key = (
-            p.arrival_date.strftime("%Y-%m-%d")
+            p.arrival_date.date().isoformat()
             if p.arrival_date
             else "unknown"
         )
@@ -7,16 +7,21 @@ analysis with enriched Gujarat crop profiles, LLM-powered advisory,
 historical weather comparison, and soil moisture data.
 """
 
+import asyncio
 import json
 import logging
 import threading
 import time
-from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import zip_longest
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
 
 import httpx
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -24,6 +29,7 @@ from app.models import WeatherCache
 from app.services.historical_weather_service import get_historical_comparison
 from app.services.llm_advisory_service import generate_llm_advisory
 from app.services.soil_data_service import fetch_crop_soil_advisory, fetch_soil_moisture
+from app.utils.helpers import load_json_file
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +53,17 @@ OPEN_METEO_TIMEZONE = "Asia/Kolkata"
 FORECAST_DAYS = 7
 API_TIMEOUT_SECONDS = 15.0
 
+# Decimal places kept per daily series in the stored cache payload (None
+# rounds to int). Only the DB copy is rounded: cache-miss responses return
+# Open-Meteo values as received, cache hits return these rounded values.
+_CACHE_DAILY_PRECISION: Dict[str, Optional[int]] = {
+    "temperature_2m_max": 1,
+    "temperature_2m_min": 1,
+    "precipitation_sum": 1,
+    "windspeed_10m_max": 1,
+    "relative_humidity_2m_max": None,
+}
+
 # ---------------------------------------------------------------------------
 # Alert Thresholds
 # ---------------------------------------------------------------------------
@@ -70,6 +87,78 @@ _crop_profiles: Optional[Dict[str, Dict[str, Any]]] = None
 _crop_profiles_lock = threading.Lock()
 
 
+@dataclass(frozen=True, slots=True)
+class _CropThresholds:
+    """Numeric profile fields used by the rule-based crop assessment."""
+
+    optimal_temp_min: float
+    optimal_temp_max: float
+    critical_temp_min: float
+    critical_temp_max: float
+    optimal_rainfall_weekly_mm: Tuple[float, float]
+    water_need: str
+    humidity_sensitive: bool = False
+    common_pests_gujarat: Tuple[str, ...] = ()
+    common_diseases_gujarat: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_profile(cls, profile: Dict[str, Any]) -> "_CropThresholds":
+        rain_min, rain_max = profile["optimal_rainfall_weekly_mm"]
+        return cls(
+            optimal_temp_min=profile["optimal_temp_min"],
+            optimal_temp_max=profile["optimal_temp_max"],
+            critical_temp_min=profile["critical_temp_min"],
+            critical_temp_max=profile["critical_temp_max"],
+            optimal_rainfall_weekly_mm=(rain_min, rain_max),
+            water_need=profile["water_need"],
+            humidity_sensitive=bool(profile.get("humidity_sensitive", False)),
+            common_pests_gujarat=tuple(profile.get("common_pests_gujarat", ())),
+            common_diseases_gujarat=tuple(profile.get("common_diseases_gujarat", ())),
+        )
+
+
+# Compiled thresholds per crop, built alongside the profiles
+_crop_thresholds: Dict[str, _CropThresholds] = {}
+
+# crop_type -> read-only enriched profile built at load time and shared
+# between analysis responses.
+_enriched_profiles: Dict[str, Mapping[str, Any]] = {}
+
+
+def _build_enriched_profile(profile: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Response-ready view of a crop profile, with display strings pre-formatted.
+
+    Lists become tuples and mappings read-only proxies, so the result can be
+    shared between responses without aliasing the loaded profile.
+    """
+    enriched_profile: Dict[str, Any] = {
+        "optimal_temp_range": f"{profile['optimal_temp_min']}-{profile['optimal_temp_max']}C",
+        "water_need": profile["water_need"],
+        "growth_season": profile["growth_season"],
+        "gujarat_varieties": tuple(profile.get("gujarat_varieties", ())),
+        "soil_types_suitable": tuple(profile.get("soil_types_suitable", ())),
+        "sowing_months": tuple(profile.get("sowing_months", ())),
+        "harvest_months": tuple(profile.get("harvest_months", ())),
+        "common_pests": tuple(profile.get("common_pests_gujarat", ())),
+        "common_diseases": tuple(profile.get("common_diseases_gujarat", ())),
+    }
+
+    # Include growth stages summary
+    growth_stages = profile.get("growth_stages", {})
+    if growth_stages:
+        enriched_profile["growth_stages"] = MappingProxyType({
+            name: MappingProxyType({
+                "duration_days": info["duration_days"],
+                "temp_range": f"{info['temp_min']}-{info['temp_max']}C",
+                "water_per_week": f"{info['water_mm_per_week']}mm",
+                "key_activity": info["key_activity"],
+            })
+            for name, info in growth_stages.items()
+        })
+    return MappingProxyType(enriched_profile)
+
+
 def _load_crop_profiles() -> Dict[str, Dict[str, Any]]:
     """Load enriched Gujarat crop profiles from JSON (lazy, thread-safe)."""
     global _crop_profiles
@@ -81,12 +170,15 @@ def _load_crop_profiles() -> Dict[str, Dict[str, Any]]:
             return _crop_profiles
         file_path = DATA_DIR / "gujarat_crop_profiles.json"
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                raw = json.load(f)
-            for profile in raw.values():
-                rain = profile.get("optimal_rainfall_weekly_mm")
-                if isinstance(rain, list) and len(rain) == 2:
-                    profile["optimal_rainfall_weekly_mm"] = tuple(rain)
+            raw = load_json_file(file_path)
+            for crop_type, profile in list(raw.items()):
+                try:
+                    _crop_thresholds[crop_type] = _CropThresholds.from_profile(profile)
+                    _enriched_profiles[crop_type] = _build_enriched_profile(profile)
+                except (KeyError, TypeError, ValueError) as exc:
+                    logger.error("Skipping malformed crop profile %s: %s", crop_type, exc)
+                    _crop_thresholds.pop(crop_type, None)
+                    del raw[crop_type]
             _crop_profiles = raw
             logger.info(
                 "Loaded %d enriched crop profiles from %s",
@@ -117,38 +209,62 @@ def _ensure_profiles_loaded() -> Dict[str, Dict[str, Any]]:
 # Module-Level Singletons (lazy-loaded, thread-safe)
 # ---------------------------------------------------------------------------
 _taluka_data: Optional[Dict[str, Dict]] = None
+# state -> district -> sorted talukas, read-only; built with _taluka_data
+_location_hierarchy: Mapping[str, Mapping[str, Tuple[str, ...]]] = MappingProxyType({})
 _taluka_lock = threading.Lock()
 
 _alert_templates: Optional[Dict[str, Dict]] = None
 _alert_templates_lock = threading.Lock()
 
+# alert_type -> crops the alert applies to, built alongside the templates
+_ALL_CROPS = "All"
+_alert_crops_index: Dict[str, FrozenSet[str]] = {}
+
+# alert_type -> builder with the template's localized fields pre-bound
+_AlertBuilder = Callable[[str, str, str], Dict[str, str]]
+_alert_builders: Dict[str, _AlertBuilder] = {}
+
 
 class _RateLimiter:
-    """In-memory token-bucket rate limiter for external API calls."""
+    """
+    In-memory token-bucket rate limiter for external API calls.
+
+    The bucket holds up to ``max_calls`` tokens and refills at
+    ``max_calls / period_seconds`` per second. Unlike a sliding window it
+    allows a burst of ``max_calls`` at once: a full bucket plus the
+    refill means up to about twice ``max_calls`` in the first period.
+    """
 
     def __init__(self, max_calls: int, period_seconds: float):
         self._max_calls = max_calls
-        self._period = period_seconds
-        self._calls: deque = deque()
+        self._refill_rate = max_calls / period_seconds
+        self._tokens: float = float(max_calls)
+        self._last = time.monotonic()
         self._lock = threading.Lock()
 
+    def _refill(self) -> None:
+        """Top up the bucket for the time elapsed since the last call (lock held)."""
+        now = time.monotonic()
+        self._tokens = min(
+            float(self._max_calls),
+            self._tokens + (now - self._last) * self._refill_rate,
+        )
+        self._last = now
+
     def acquire(self) -> bool:
         with self._lock:
-            now = time.monotonic()
-            while self._calls and (now - self._calls[0]) > self._period:
-                self._calls.popleft()
-            if len(self._calls) >= self._max_calls:
+            self._refill()
+            if self._tokens < 1.0:
                 return False
-            self._calls.append(now)
+            self._tokens -= 1.0
             return True
 
     @property
     def remaining(self) -> int:
-        with self._lock:
-            now = time.monotonic()
-            while self._calls and (now - self._calls[0]) > self._period:
-                self._calls.popleft()
-            return max(0, self._max_calls - len(self._calls))
+        # Read-only projection of the bucket; advisory, so no lock is taken.
+        tokens, last = self._tokens, self._last
+        projected = tokens + (time.monotonic() - last) * self._refill_rate
+        return max(0, int(min(float(self._max_calls), projected)))
 
 
 _api_rate_limiter = _RateLimiter(
@@ -161,9 +277,22 @@ _api_rate_limiter = _RateLimiter(
 # Taluka Resolution
 # ---------------------------------------------------------------------------
 
+def _build_location_hierarchy(
+    data: Dict[str, Dict]
+) -> Mapping[str, Mapping[str, Tuple[str, ...]]]:
+    """Freeze the taluka map into a read-only state/district/taluka hierarchy."""
+    return MappingProxyType({
+        state_name: MappingProxyType({
+            district_name: tuple(sorted(talukas))
+            for district_name, talukas in districts.items()
+        })
+        for state_name, districts in data.items()
+    })
+
+
 def _load_taluka_data() -> Dict[str, Dict]:
     """Load taluka coordinate mapping from JSON (lazy, thread-safe)."""
-    global _taluka_data
+    global _taluka_data, _location_hierarchy
     if _taluka_data is not None:
         return _taluka_data
 
@@ -172,27 +301,28 @@ def _load_taluka_data() -> Dict[str, Dict]:
             return _taluka_data
         file_path = DATA_DIR / "taluka_coordinates.json"
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                _taluka_data = json.load(f)
+            data = load_json_file(file_path)
             logger.info("Loaded taluka data from %s", file_path)
         except FileNotFoundError:
             logger.error("Taluka data file not found: %s", file_path)
-            _taluka_data = {}
+            data = {}
         except json.JSONDecodeError as exc:
             logger.error("Invalid JSON in taluka data file: %s", exc)
-            _taluka_data = {}
+            data = {}
+        # Publish the hierarchy first: the unlocked fast path checks _taluka_data.
+        _location_hierarchy = _build_location_hierarchy(data)
+        _taluka_data = data
     return _taluka_data
 
 
-def get_location_hierarchy() -> Dict[str, Any]:
-    """Return the full location hierarchy for the frontend."""
-    data = _load_taluka_data()
-    hierarchy: Dict[str, Any] = {}
-    for state_name, districts in data.items():
-        hierarchy[state_name] = {}
-        for district_name, talukas in districts.items():
-            hierarchy[state_name][district_name] = sorted(talukas.keys())
-    return hierarchy
+def get_location_hierarchy() -> Mapping[str, Mapping[str, Tuple[str, ...]]]:
+    """
+    Return the full location hierarchy for the frontend.
+
+    Built once when the taluka map loads and shared read-only between callers.
+    """
+    _load_taluka_data()
+    return _location_hierarchy
 
 
 def resolve_taluka(
@@ -235,33 +365,72 @@ def _load_alert_templates() -> Dict[str, Dict]:
             return _alert_templates
         file_path = DATA_DIR / "weather_alerts.json"
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                raw = json.load(f)
-            _alert_templates = {item["alert_type"]: item for item in raw}
+            raw = load_json_file(file_path)
+            templates = {item["alert_type"]: item for item in raw}
+            _alert_crops_index.update(
+                (alert_type, frozenset(item.get("affected_crops", [_ALL_CROPS])))
+                for alert_type, item in templates.items()
+            )
+            _alert_builders.update(
+                (alert_type, _make_alert_builder(alert_type, item))
+                for alert_type, item in templates.items()
+            )
+            _alert_templates = templates
             logger.info("Loaded %d alert templates", len(_alert_templates))
         except Exception as exc:
             logger.error("Failed to load alert templates: %s", exc)
+            _alert_crops_index.clear()
+            _alert_builders.clear()
             _alert_templates = {}
     return _alert_templates
 
 
+@lru_cache(maxsize=64)
+def _excluded_alert_types(crop_type: str) -> FrozenSet[str]:
+    """Alert types whose template restricts them to crops other than ``crop_type``."""
+    _load_alert_templates()
+    return frozenset(
+        alert_type
+        for alert_type, crops in _alert_crops_index.items()
+        if _ALL_CROPS not in crops and crop_type not in crops
+    )
+
+
+def _make_alert_builder(alert_type: str, template: Mapping[str, Any]) -> _AlertBuilder:
+    """Bind one template's static fields so building an alert is a single dict literal."""
+    title = template.get("title", alert_type.replace("_", " ").title())
+    title_hindi = template.get("title_hindi", "")
+    recommendation = template.get("recommendation")
+    has_recommendation = "recommendation" in template
+    recommendation_hindi = template.get("recommendation_hindi", "")
+
+    def build(severity: str, message: str, fallback_recommendation: str) -> Dict[str, str]:
+        return {
+            "type": alert_type,
+            "severity": severity,
+            "title": title,
+            "title_hindi": title_hindi,
+            "message": message,
+            "recommendation": (
+                recommendation if has_recommendation else fallback_recommendation
+            ),
+            "recommendation_hindi": recommendation_hindi,
+        }
+
+    return build
+
+
 def _build_alert(
     alert_type: str,
     severity: str,
     message: str,
     fallback_recommendation: str,
 ) -> Dict[str, str]:
-    templates = _load_alert_templates()
-    template = templates.get(alert_type, {})
-    return {
-        "type": alert_type,
-        "severity": severity,
-        "title": template.get("title", alert_type.replace("_", " ").title()),
-        "title_hindi": template.get("title_hindi", ""),
-        "message": message,
-        "recommendation": template.get("recommendation", fallback_recommendation),
-        "recommendation_hindi": template.get("recommendation_hindi", ""),
-    }
+    _load_alert_templates()
+    builder = _alert_builders.get(alert_type)
+    if builder is None:
+        builder = _make_alert_builder(alert_type, {})
+    return builder(severity, message, fallback_recommendation)
 
 
 # ---------------------------------------------------------------------------
@@ -273,8 +442,8 @@ def get_cached_forecast(
 ) -> Optional[Tuple[Dict, datetime]]:
     now = datetime.now(timezone.utc)
     try:
-        entry = (
-            db.query(WeatherCache)
+        row = (
+            db.query(WeatherCache.forecast_data, WeatherCache.cached_at)
             .filter(
                 WeatherCache.taluka == taluka,
                 WeatherCache.expires_at > now,
@@ -282,14 +451,54 @@ def get_cached_forecast(
             .order_by(WeatherCache.cached_at.desc())
             .first()
         )
-        if entry:
-            forecast = json.loads(entry.forecast_data)
-            return forecast, entry.cached_at
+        if row is not None:
+            return row.forecast_data, row.cached_at
     except Exception as exc:
         logger.warning("Cache read failed for taluka %s: %s", taluka, exc)
     return None
 
 
+# Cache writes go through a Core INSERT: one row per call needs none of the
+# ORM's identity-map or unit-of-work bookkeeping.
+_WEATHER_CACHE_INSERT = insert(WeatherCache)
+
+
+def _forecast_cache_row(
+    taluka: str,
+    latitude: float,
+    longitude: float,
+    forecast_data: Dict,
+    cached_at: datetime,
+) -> Dict[str, Any]:
+    return {
+        "taluka": taluka,
+        "latitude": latitude,
+        "longitude": longitude,
+        "forecast_data": forecast_data,
+        "cached_at": cached_at,
+        "expires_at": cached_at + timedelta(hours=settings.WEATHER_CACHE_HOURS),
+    }
+
+
+def _compact_forecast(data: Dict) -> Dict:
+    """
+    Copy of ``data`` with the daily series rounded to _CACHE_DAILY_PRECISION,
+    so the cached JSON carries fewer digits. ``data`` itself is not modified;
+    the caller still returns it to the client.
+    """
+    daily = data.get("daily")
+    if not isinstance(daily, dict):
+        return data
+    compact_daily = dict(daily)
+    for key, ndigits in _CACHE_DAILY_PRECISION.items():
+        values = daily.get(key)
+        if isinstance(values, list):
+            compact_daily[key] = [
+                round(v, ndigits) if isinstance(v, float) else v for v in values
+            ]
+    return {**data, "daily": compact_daily}
+
+
 def store_forecast_cache(
     db: Session,
     taluka: str,
@@ -298,19 +507,15 @@ def store_forecast_cache(
     forecast_data: Dict,
 ) -> None:
     now = datetime.now(timezone.utc)
-    expires_at = now + timedelta(hours=settings.WEATHER_CACHE_HOURS)
+    row = _forecast_cache_row(
+        taluka, latitude, longitude, _compact_forecast(forecast_data), now
+    )
     try:
-        entry = WeatherCache(
-            taluka=taluka,
-            latitude=latitude,
-            longitude=longitude,
-            forecast_data=json.dumps(forecast_data),
-            cached_at=now,
-            expires_at=expires_at,
-        )
-        db.add(entry)
+        db.execute(_WEATHER_CACHE_INSERT, row)
         db.commit()
-        logger.info("Cached forecast for taluka %s (expires %s)", taluka, expires_at)
+        logger.info(
+            "Cached forecast for taluka %s (expires %s)", taluka, row["expires_at"]
+        )
     except Exception as exc:
         logger.warning("Cache write failed for taluka %s: %s", taluka, exc)
         db.rollback()
@@ -338,14 +543,58 @@ def cleanup_expired_cache(db: Session) -> int:
 # Open-Meteo API Integration
 # ---------------------------------------------------------------------------
 
-async def fetch_forecast_from_api(
-    latitude: float, longitude: float
-) -> Dict:
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared Open-Meteo client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=API_TIMEOUT_SECONDS,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared Open-Meteo client (called on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+async def _request_open_meteo(params: Dict[str, Any]) -> Any:
+    """Issue one rate-limited Open-Meteo forecast request and return its JSON."""
     if not _api_rate_limiter.acquire():
         raise RuntimeError(
             "External API rate limit exceeded. Please retry after a short wait."
         )
 
+    try:
+        response = await _get_http_client().get(settings.OPEN_METEO_API_URL, params=params)
+        response.raise_for_status()
+        data = response.json()
+        logger.info("Open-Meteo response received (status %d)", response.status_code)
+        return data
+    except httpx.TimeoutException:
+        logger.error(
+            "Open-Meteo API timed out (lat=%s, lon=%s)",
+            params["latitude"], params["longitude"],
+        )
+        raise RuntimeError("Weather API request timed out. Please try again.")
+    except httpx.HTTPStatusError as exc:
+        logger.error("Open-Meteo HTTP error %d: %s", exc.response.status_code, exc.response.text[:200])
+        raise RuntimeError(f"Weather API returned status {exc.response.status_code}")
+    except httpx.RequestError as exc:
+        logger.error("Open-Meteo request failed: %s", exc)
+        raise RuntimeError("Failed to connect to weather API. Please try again later.")
+
+
+async def fetch_forecast_from_api(
+    latitude: float, longitude: float
+) -> Dict:
     params = {
         "latitude": latitude,
         "longitude": longitude,
@@ -358,29 +607,70 @@ async def fetch_forecast_from_api(
         "Fetching forecast from Open-Meteo | lat=%.4f lon=%.4f",
         latitude, longitude,
     )
-
-    try:
-        async with httpx.AsyncClient(timeout=API_TIMEOUT_SECONDS) as client:
-            response = await client.get(settings.OPEN_METEO_API_URL, params=params)
-            response.raise_for_status()
-            data = response.json()
-            logger.info("Open-Meteo response received (status %d)", response.status_code)
-            return data
-    except httpx.TimeoutException:
-        logger.error("Open-Meteo API timed out (lat=%.4f, lon=%.4f)", latitude, longitude)
-        raise RuntimeError("Weather API request timed out. Please try again.")
-    except httpx.HTTPStatusError as exc:
-        logger.error("Open-Meteo HTTP error %d: %s", exc.response.status_code, exc.response.text[:200])
-        raise RuntimeError(f"Weather API returned status {exc.response.status_code}")
-    except httpx.RequestError as exc:
-        logger.error("Open-Meteo request failed: %s", exc)
-        raise RuntimeError("Failed to connect to weather API. Please try again later.")
+    return await _request_open_meteo(params)
 
 
 # ---------------------------------------------------------------------------
 # Orchestrated Forecast Retrieval (cache-first)
 # ---------------------------------------------------------------------------
 
+@dataclass
+class _InflightFetch:
+    """A shared upstream fetch and whether a caller has claimed its result."""
+
+    task: "asyncio.Task[Dict]"
+    claimed: bool = False
+
+
+# Open-Meteo fetches currently in flight, keyed by taluka. Check-and-insert
+# happens without an intervening await, so the event loop makes it atomic.
+_inflight: Dict[str, _InflightFetch] = {}
+
+
+async def _fetch_and_release(taluka: str, lat: float, lon: float) -> Dict:
+    """Fetch one forecast upstream, then retire its ``_inflight`` entry."""
+    try:
+        return await fetch_forecast_from_api(lat, lon)
+    finally:
+        _inflight.pop(taluka, None)
+
+
+def _retrieve_task_exception(task: "asyncio.Task[Dict]") -> None:
+    """Mark a failure as retrieved when every requester has gone away."""
+    if not task.cancelled():
+        task.exception()
+
+
+async def _fetch_forecast_coalesced(
+    taluka: str, lat: float, lon: float
+) -> Tuple[Dict, bool]:
+    """
+    Fetch a forecast, sharing one upstream call per taluka.
+
+    Only the HTTP fetch is shared. It runs in its own task, and every
+    caller, the first included, awaits it through ``asyncio.shield``: a
+    cancelled or disconnected request stops waiting without cancelling
+    the fetch for the others.
+
+    Returns ``(forecast_data, claimed)``, where ``claimed`` is True for
+    the first caller to receive the result, which should cache it. A
+    caller cancelled before the fetch finishes never claims, so the
+    result is still cached by whichever caller is left.
+    """
+    fetch = _inflight.get(taluka)
+    if fetch is None:
+        task = asyncio.create_task(_fetch_and_release(taluka, lat, lon))
+        task.add_done_callback(_retrieve_task_exception)
+        fetch = _inflight[taluka] = _InflightFetch(task)
+    else:
+        logger.info("Joining in-flight forecast fetch for taluka %s", taluka)
+    forecast_data = await asyncio.shield(fetch.task)
+    # No await between the check and the set, so exactly one caller claims
+    claimed = not fetch.claimed
+    fetch.claimed = True
+    return forecast_data, claimed
+
+
 async def get_forecast(
     db: Session, state: str, district: str, taluka: str
 ) -> Dict[str, Any]:
@@ -413,8 +703,9 @@ async def get_forecast(
             "cached_at": cached_at.isoformat() if cached_at else None,
         }
 
-    forecast_data = await fetch_forecast_from_api(lat, lon)
-    store_forecast_cache(db, taluka, lat, lon, forecast_data)
+    forecast_data, claimed = await _fetch_forecast_coalesced(taluka, lat, lon)
+    if claimed:
+        store_forecast_cache(db, taluka, lat, lon, forecast_data)
 
     return {
         "taluka": taluka,
@@ -427,6 +718,114 @@ async def get_forecast(
     }
 
 
+# ---------------------------------------------------------------------------
+# Daily Forecast Aggregation
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _DailyStats:
+    """Aggregates over the Open-Meteo ``daily`` arrays, built in one pass."""
+
+    dates: List[str]
+    tmax_count: int = 0
+    tmax_sum: float = 0
+    tmax_peak: Optional[float] = None
+    heat_run: int = 0
+    heat_peak: float = 0.0
+    tmin_count: int = 0
+    tmin_sum: float = 0
+    tmin_low: Optional[float] = None
+    tmin_low_idx: int = 0
+    cold_days: int = 0
+    frost_days: int = 0
+    precip_count: int = 0
+    precip_sum: float = 0
+    precip_peak: Optional[float] = None
+    precip_peak_idx: int = 0
+    dry_days: int = 0
+    rainy_days: int = 0
+    heavy_days: int = 0
+    wind_count: int = 0
+    wind_sum: float = 0
+    wind_peak: Optional[float] = None
+    wind_peak_idx: int = 0
+    windy_days: int = 0
+    humidity_count: int = 0
+    humidity_sum: float = 0
+    humidity_peak: Optional[float] = None
+    humid_days: int = 0
+
+
+def _scan_daily(daily: Dict[str, List]) -> _DailyStats:
+    """Compute every summary and alert aggregate in a single walk of ``daily``."""
+    stats = _DailyStats(dates=daily.get("time", []))
+    heat_run = 0
+
+    for i, (t_max, t_min, p, w, h) in enumerate(zip_longest(
+        daily.get("temperature_2m_max", []),
+        daily.get("temperature_2m_min", []),
+        daily.get("precipitation_sum", []),
+        daily.get("windspeed_10m_max", []),
+        daily.get("relative_humidity_2m_max", []),
+    )):
+        if t_max is not None:
+            stats.tmax_count += 1
+            stats.tmax_sum += t_max
+            if stats.tmax_peak is None or t_max > stats.tmax_peak:
+                stats.tmax_peak = t_max
+            if t_max > ALERT_HEAT_STRESS_TEMP_C:
+                heat_run += 1
+                if t_max > stats.heat_peak:
+                    stats.heat_peak = t_max
+                if heat_run > stats.heat_run:
+                    stats.heat_run = heat_run
+            else:
+                heat_run = 0
+
+        if t_min is not None:
+            stats.tmin_count += 1
+            stats.tmin_sum += t_min
+            if stats.tmin_low is None or t_min < stats.tmin_low:
+                stats.tmin_low = t_min
+                stats.tmin_low_idx = i
+            if t_min < ALERT_COLD_WAVE_TEMP_C:
+                stats.cold_days += 1
+            if t_min < ALERT_FROST_RISK_TEMP_C:
+                stats.frost_days += 1
+
+        if p is not None:
+            stats.precip_count += 1
+            stats.precip_sum += p
+            if stats.precip_peak is None or p > stats.precip_peak:
+                stats.precip_peak = p
+                stats.precip_peak_idx = i
+            if p < ALERT_DRY_SPELL_PRECIP_MM:
+                stats.dry_days += 1
+            if p >= 1.0:
+                stats.rainy_days += 1
+            if p > ALERT_HEAVY_RAIN_MM:
+                stats.heavy_days += 1
+
+        if w is not None:
+            stats.wind_count += 1
+            stats.wind_sum += w
+            if stats.wind_peak is None or w > stats.wind_peak:
+                stats.wind_peak = w
+                stats.wind_peak_idx = i
+            if w > ALERT_STRONG_WIND_KMH:
+                stats.windy_days += 1
+
+        if h is not None:
+            stats.humidity_count += 1
+            stats.humidity_sum += h
+            if stats.humidity_peak is None or h > stats.humidity_peak:
+                stats.humidity_peak = h
+            if h > ALERT_HIGH_HUMIDITY_PCT:
+                stats.humid_days += 1
+
+    return stats
+
+
 # ---------------------------------------------------------------------------
 # Alert Generation
 # ---------------------------------------------------------------------------
@@ -434,101 +833,59 @@ async def get_forecast(
 def generate_alerts(
     forecast_data: Dict,
     crop_type: Optional[str] = None,
+    stats: Optional[_DailyStats] = None,
 ) -> List[Dict]:
-    daily = forecast_data.get("daily", {})
-    temps_max = daily.get("temperature_2m_max", [])
-    temps_min = daily.get("temperature_2m_min", [])
-    precip = daily.get("precipitation_sum", [])
-    wind = daily.get("windspeed_10m_max", [])
-    humidity = daily.get("relative_humidity_2m_max", [])
-    dates = daily.get("time", [])
-
-    alerts: List[Dict] = []
-
-    if precip and len(precip) >= ALERT_DRY_SPELL_DAYS:
-        dry_days = sum(1 for p in precip if p < ALERT_DRY_SPELL_PRECIP_MM)
-        if dry_days >= ALERT_DRY_SPELL_DAYS:
-            total_precip = sum(precip)
-            alerts.append(
-                _build_alert("dry_spell", "warning",
-                    f"No significant rainfall expected for the next {dry_days} days. Total expected: {total_precip:.1f}mm.",
-                    "Schedule irrigation immediately. Use drip or sprinkler systems to conserve water."))
-
-    if precip:
-        heavy_days = [(_safe_date(dates, i), p) for i, p in enumerate(precip) if p > ALERT_HEAVY_RAIN_MM]
-        if heavy_days:
-            worst = max(heavy_days, key=lambda x: x[1])
-            alerts.append(
-                _build_alert("heavy_rain", "danger",
-                    f"Heavy rainfall expected: {worst[1]:.1f}mm on {worst[0]}. {len(heavy_days)} day(s) with >{ALERT_HEAVY_RAIN_MM:.0f}mm rain.",
-                    "Ensure drainage. Harvest mature crops. Protect stored grains from moisture."))
-
-    if temps_max:
-        consecutive = 0
-        max_consecutive = 0
-        peak_temp = 0.0
-        for t in temps_max:
-            if t > ALERT_HEAT_STRESS_TEMP_C:
-                consecutive += 1
-                peak_temp = max(peak_temp, t)
-                max_consecutive = max(max_consecutive, consecutive)
-            else:
-                consecutive = 0
-        if max_consecutive >= ALERT_HEAT_STRESS_DAYS:
-            alerts.append(
-                _build_alert("heat_stress", "warning",
-                    f"Heat stress: temperature above {ALERT_HEAT_STRESS_TEMP_C:.0f}C for {max_consecutive} consecutive days. Peak: {peak_temp:.1f}C.",
-                    "Increase irrigation. Apply mulch. Avoid field work 11 AM - 4 PM."))
-
-    if temps_min:
-        cold_days = [(_safe_date(dates, i), t) for i, t in enumerate(temps_min) if t < ALERT_COLD_WAVE_TEMP_C]
-        if cold_days:
-            coldest = min(cold_days, key=lambda x: x[1])
-            if coldest[1] >= ALERT_FROST_RISK_TEMP_C:
-                alerts.append(
-                    _build_alert("cold_wave", "warning",
-                        f"Cold wave: minimum temperature {coldest[1]:.1f}C expected on {coldest[0]}. {len(cold_days)} cold day(s) in forecast.",
-                        "Cover sensitive crops. Use smoke/fogging. Irrigate in evening for frost protection."))
-
-    if temps_min:
-        frost_days = [(_safe_date(dates, i), t) for i, t in enumerate(temps_min) if t < ALERT_FROST_RISK_TEMP_C]
-        if frost_days:
-            coldest = min(frost_days, key=lambda x: x[1])
-            alerts.append(
-                _build_alert("frost_risk", "danger",
-                    f"Frost risk: minimum temperature {coldest[1]:.1f}C expected on {coldest[0]}. {len(frost_days)} frost-risk day(s).",
-                    "Immediate action: cover crops with plastic. Use heaters in orchards. Harvest mature crops."))
-
-    if humidity:
-        humid_days = sum(1 for h in humidity if h > ALERT_HIGH_HUMIDITY_PCT)
-        if humid_days >= ALERT_HIGH_HUMIDITY_DAYS:
-            peak_humidity = max(humidity)
-            alerts.append(
-                _build_alert("high_humidity", "info",
-                    f"High humidity (>{ALERT_HIGH_HUMIDITY_PCT}%) expected for {humid_days} days. Peak: {peak_humidity:.0f}%. Increased fungal disease risk.",
-                    "Apply preventive fungicides. Ensure air circulation. Avoid overhead irrigation."))
-
-    if wind:
-        windy_days = [(_safe_date(dates, i), w) for i, w in enumerate(wind) if w > ALERT_STRONG_WIND_KMH]
-        if windy_days:
-            worst = max(windy_days, key=lambda x: x[1])
-            alerts.append(
-                _build_alert("strong_winds", "warning",
-                    f"Strong winds expected: {worst[1]:.1f} km/h on {worst[0]}. {len(windy_days)} windy day(s).",
-                    "Support tall crops with stakes. Secure greenhouses. Avoid spraying."))
-
-    if crop_type:
-        templates = _load_alert_templates()
-        filtered = []
-        for alert in alerts:
-            template = templates.get(alert["type"], {})
-            affected = template.get("affected_crops", ["All"])
-            if "All" in affected or crop_type in affected:
-                filtered.append(alert)
-        alerts = filtered
-
-    alerts.sort(key=lambda a: SEVERITY_ORDER.get(a["severity"], 0), reverse=True)
-    return alerts
+    if stats is None:
+        stats = _scan_daily(forecast_data.get("daily", {}))
+    dates = stats.dates
+    excluded = _excluded_alert_types(crop_type) if crop_type else frozenset()
+
+    # One bucket per severity level, indexed by SEVERITY_ORDER, so the
+    # result comes out most-severe-first without a final sort.
+    buckets: Tuple[List[Dict], ...] = ([], [], [])
+
+    def emit(alert_type: str, severity: str, message: str, fallback: str) -> None:
+        if alert_type not in excluded:
+            buckets[SEVERITY_ORDER[severity]].append(
+                _build_alert(alert_type, severity, message, fallback)
+            )
+
+    if stats.precip_count >= ALERT_DRY_SPELL_DAYS and stats.dry_days >= ALERT_DRY_SPELL_DAYS:
+        emit("dry_spell", "warning",
+             f"No significant rainfall expected for the next {stats.dry_days} days. Total expected: {stats.precip_sum:.1f}mm.",
+             "Schedule irrigation immediately. Use drip or sprinkler systems to conserve water.")
+
+    if stats.heavy_days:
+        emit("heavy_rain", "danger",
+             f"Heavy rainfall expected: {stats.precip_peak:.1f}mm on {_safe_date(dates, stats.precip_peak_idx)}. {stats.heavy_days} day(s) with >{ALERT_HEAVY_RAIN_MM:.0f}mm rain.",
+             "Ensure drainage. Harvest mature crops. Protect stored grains from moisture.")
+
+    if stats.heat_run >= ALERT_HEAT_STRESS_DAYS:
+        emit("heat_stress", "warning",
+             f"Heat stress: temperature above {ALERT_HEAT_STRESS_TEMP_C:.0f}C for {stats.heat_run} consecutive days. Peak: {stats.heat_peak:.1f}C.",
+             "Increase irrigation. Apply mulch. Avoid field work 11 AM - 4 PM.")
+
+    # The coldest day decides between cold wave and frost risk.
+    if stats.frost_days:
+        emit("frost_risk", "danger",
+             f"Frost risk: minimum temperature {stats.tmin_low:.1f}C expected on {_safe_date(dates, stats.tmin_low_idx)}. {stats.frost_days} frost-risk day(s).",
+             "Immediate action: cover crops with plastic. Use heaters in orchards. Harvest mature crops.")
+    elif stats.cold_days:
+        emit("cold_wave", "warning",
+             f"Cold wave: minimum temperature {stats.tmin_low:.1f}C expected on {_safe_date(dates, stats.tmin_low_idx)}. {stats.cold_days} cold day(s) in forecast.",
+             "Cover sensitive crops. Use smoke/fogging. Irrigate in evening for frost protection.")
+
+    if stats.humid_days >= ALERT_HIGH_HUMIDITY_DAYS:
+        emit("high_humidity", "info",
+             f"High humidity (>{ALERT_HIGH_HUMIDITY_PCT}%) expected for {stats.humid_days} days. Peak: {stats.humidity_peak:.0f}%. Increased fungal disease risk.",
+             "Apply preventive fungicides. Ensure air circulation. Avoid overhead irrigation.")
+
+    if stats.windy_days:
+        emit("strong_winds", "warning",
+             f"Strong winds expected: {stats.wind_peak:.1f} km/h on {_safe_date(dates, stats.wind_peak_idx)}. {stats.windy_days} windy day(s).",
+             "Support tall crops with stakes. Secure greenhouses. Avoid spraying.")
+
+    return [*buckets[2], *buckets[1], *buckets[0]]
 
 
 def _safe_date(dates: List[str], index: int) -> str:
@@ -551,52 +908,48 @@ def determine_overall_severity(alerts: List[Dict]) -> str:
 # Crop Weather Analysis
 # ---------------------------------------------------------------------------
 
-def _compute_forecast_summary(forecast_data: Dict) -> Dict[str, Any]:
-    daily = forecast_data.get("daily", {})
-    temps_max = daily.get("temperature_2m_max", [])
-    temps_min = daily.get("temperature_2m_min", [])
-    precip = daily.get("precipitation_sum", [])
-    wind = daily.get("windspeed_10m_max", [])
-    humidity = daily.get("relative_humidity_2m_max", [])
-    dates = daily.get("time", [])
-
-    def _avg(vals: list) -> Optional[float]:
-        return round(sum(vals) / len(vals), 1) if vals else None
+def _compute_forecast_summary(
+    forecast_data: Dict,
+    stats: Optional[_DailyStats] = None,
+) -> Dict[str, Any]:
+    if stats is None:
+        stats = _scan_daily(forecast_data.get("daily", {}))
+    dates = stats.dates
 
-    def _peak(vals: list) -> Optional[float]:
-        return round(max(vals), 1) if vals else None
+    def _avg(total: float, count: int) -> Optional[float]:
+        return round(total / count, 1) if count else None
 
-    def _low(vals: list) -> Optional[float]:
-        return round(min(vals), 1) if vals else None
+    def _round(value: Optional[float]) -> Optional[float]:
+        return round(value, 1) if value is not None else None
 
     return {
         "period_start": dates[0] if dates else None,
         "period_end": dates[-1] if dates else None,
         "days": len(dates),
         "temperature": {
-            "avg_max": _avg(temps_max),
-            "avg_min": _avg(temps_min),
-            "peak_max": _peak(temps_max),
-            "lowest_min": _low(temps_min),
+            "avg_max": _avg(stats.tmax_sum, stats.tmax_count),
+            "avg_min": _avg(stats.tmin_sum, stats.tmin_count),
+            "peak_max": _round(stats.tmax_peak),
+            "lowest_min": _round(stats.tmin_low),
         },
         "rainfall": {
-            "total_mm": round(sum(precip), 1) if precip else 0,
-            "max_daily_mm": _peak(precip),
-            "rainy_days": sum(1 for p in precip if p >= 1.0),
+            "total_mm": round(stats.precip_sum, 1) if stats.precip_count else 0,
+            "max_daily_mm": _round(stats.precip_peak),
+            "rainy_days": stats.rainy_days,
         },
         "wind": {
-            "avg_speed_kmh": _avg(wind),
-            "max_speed_kmh": _peak(wind),
+            "avg_speed_kmh": _avg(stats.wind_sum, stats.wind_count),
+            "max_speed_kmh": _round(stats.wind_peak),
         },
         "humidity": {
-            "avg_percent": _avg(humidity),
-            "max_percent": _peak(humidity),
+            "avg_percent": _avg(stats.humidity_sum, stats.humidity_count),
+            "max_percent": _round(stats.humidity_peak),
         },
     }
 
 
 def _assess_crop_suitability(
-    summary: Dict[str, Any], profile: Dict[str, Any]
+    summary: Dict[str, Any], profile: "_CropThresholds"
 ) -> str:
     issues = 0
     critical = 0
@@ -606,17 +959,17 @@ def _assess_crop_suitability(
     total_rain = summary["rainfall"]["total_mm"]
 
     if (
-        temp_avg_max > profile["critical_temp_max"]
-        or temp_avg_min < profile["critical_temp_min"]
+        temp_avg_max > profile.critical_temp_max
+        or temp_avg_min < profile.critical_temp_min
     ):
         critical += 1
     elif (
-        temp_avg_max > profile["optimal_temp_max"]
-        or temp_avg_min < profile["optimal_temp_min"]
+        temp_avg_max > profile.optimal_temp_max
+        or temp_avg_min < profile.optimal_temp_min
     ):
         issues += 1
 
-    rain_min, rain_max = profile["optimal_rainfall_weekly_mm"]
+    rain_min, rain_max = profile.optimal_rainfall_weekly_mm
     if total_rain < rain_min * 0.3 or total_rain > rain_max * 2.5:
         critical += 1
     elif total_rain < rain_min or total_rain > rain_max:
@@ -633,7 +986,7 @@ def _assess_crop_suitability(
 
 def _generate_farming_recommendations(
     summary: Dict[str, Any],
-    profile: Dict[str, Any],
+    profile: "_CropThresholds",
     crop_type: str,
     alerts: List[Dict],
 ) -> Dict[str, str]:
@@ -641,7 +994,7 @@ def _generate_farming_recommendations(
     recommendations: Dict[str, str] = {}
 
     total_rain = summary["rainfall"]["total_mm"]
-    rain_min, rain_max = profile["optimal_rainfall_weekly_mm"]
+    rain_min, rain_max = profile.optimal_rainfall_weekly_mm
     temp_avg_max = summary["temperature"]["avg_max"] or 0
     temp_avg_min = summary["temperature"]["avg_min"] or 0
     rainy_days = summary["rainfall"]["rainy_days"]
@@ -650,10 +1003,10 @@ def _generate_farming_recommendations(
 
     if total_rain < rain_min:
         deficit = rain_min - total_rain
-        if profile["water_need"] in ("high", "very_high"):
+        if profile.water_need in ("high", "very_high"):
             recommendations["irrigation"] = (
                 f"Rainfall deficit of {deficit:.0f}mm expected this week. "
-                f"{crop_type} requires {profile['water_need'].replace('_', ' ')} water input. "
+                f"{crop_type} requires {profile.water_need.replace('_', ' ')} water input. "
                 "Schedule irrigation every 2-3 days using flood or drip irrigation."
             )
         else:
@@ -683,7 +1036,7 @@ def _generate_farming_recommendations(
             f"Rain expected on {rainy_days} day(s). Plan spraying for dry days. "
             "Apply systemic pesticides that are rain-fast within 2 hours."
         )
-    elif avg_humidity > 70 and profile.get("humidity_sensitive"):
+    elif avg_humidity > 70 and profile.humidity_sensitive:
         recommendations["spraying"] = (
             f"High humidity ({avg_humidity:.0f}%) increases fungal disease risk for {crop_type}. "
             "Apply preventive fungicide spray. Best time: early morning."
@@ -700,7 +1053,7 @@ def _generate_farming_recommendations(
             "Heavy rain expected. If crop is mature, harvest immediately before rain. "
             "Ensure harvested produce is stored in dry, covered areas."
         )
-    elif rainy_days == 0 and temp_avg_max < profile.get("critical_temp_max", 42):
+    elif rainy_days == 0 and temp_avg_max < profile.critical_temp_max:
         recommendations["harvesting"] = (
             "Dry weather expected for the forecast period. Excellent conditions for harvesting. "
             "Plan harvest operations during morning hours for best grain quality."
@@ -717,12 +1070,12 @@ def _generate_farming_recommendations(
         )
 
     general_parts = []
-    if temp_avg_max > profile["optimal_temp_max"]:
+    if temp_avg_max > profile.optimal_temp_max:
         general_parts.append(
             f"Daytime temperature ({temp_avg_max:.1f}C) is above optimal for {crop_type}. "
             "Consider mulching and providing shade for young plants."
         )
-    if temp_avg_min < profile["optimal_temp_min"]:
+    if temp_avg_min < profile.optimal_temp_min:
         general_parts.append(
             f"Night temperature ({temp_avg_min:.1f}C) is below optimal for {crop_type}. "
             "Protect young plants from cold."
@@ -733,8 +1086,8 @@ def _generate_farming_recommendations(
         )
 
     # Add Gujarat-specific pest/disease info
-    pests = profile.get("common_pests_gujarat", [])
-    diseases = profile.get("common_diseases_gujarat", [])
+    pests = profile.common_pests_gujarat
+    diseases = profile.common_diseases_gujarat
     if pests or diseases:
         pest_parts = []
         if avg_humidity > 70 and diseases:
@@ -759,6 +1112,16 @@ def _generate_farming_recommendations(
 # Comprehensive Crop Weather Analysis (main orchestrator)
 # ---------------------------------------------------------------------------
 
+def _enrichment_result(label: str, result: Any) -> Any:
+    """Unwrap one ``asyncio.gather`` result, logging and dropping failures."""
+    if isinstance(result, Exception):
+        logger.warning("%s failed: %s", label, result)
+        return None
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
 async def analyze_crop_weather(
     db: Session,
     state: str,
@@ -789,76 +1152,54 @@ async def analyze_crop_weather(
     location = resolve_taluka(state, district, taluka)
 
     # 2. Compute summary and rule-based analysis
-    summary = _compute_forecast_summary(forecast_data)
-    alerts = generate_alerts(forecast_data, crop_type=crop_type)
-    suitability = _assess_crop_suitability(summary, profile)
+    stats = _scan_daily(forecast_data.get("daily", {}))
+    summary = _compute_forecast_summary(forecast_data, stats=stats)
+    alerts = generate_alerts(forecast_data, crop_type=crop_type, stats=stats)
+    thresholds = _crop_thresholds[crop_type]
+    suitability = _assess_crop_suitability(summary, thresholds)
     rule_recommendations = _generate_farming_recommendations(
-        summary, profile, crop_type, alerts
+        summary, thresholds, crop_type, alerts
     )
 
     # 3. Fetch enrichment data in parallel (best-effort, failures are non-fatal)
     lat = location["lat"] if location else 0
     lon = location["lon"] if location else 0
 
-    historical = None
-    soil_data = None
-    govt_advisory = None
-    ai_advisory = None
-
-    try:
-        historical = await get_historical_comparison(lat, lon, summary)
-    except Exception as exc:
-        logger.warning("Historical comparison failed: %s", exc)
-
-    try:
-        soil_data = await fetch_soil_moisture(lat, lon)
-    except Exception as exc:
-        logger.warning("Soil moisture fetch failed: %s", exc)
-
+    # The district advisory feeds only the response, not the LLM prompt, so
+    # it runs alongside the whole historical/soil -> LLM chain.
+    govt_task = asyncio.ensure_future(fetch_crop_soil_advisory(district))
     try:
-        govt_advisory = await fetch_crop_soil_advisory(district)
-    except Exception as exc:
-        logger.warning("Govt advisory fetch failed: %s", exc)
-
-    # 4. Generate LLM advisory (uses all collected data)
-    try:
-        ai_advisory = await generate_llm_advisory(
-            location=location or {"taluka": taluka, "district": district, "state": state},
-            forecast_summary=summary,
-            crop_type=crop_type,
-            crop_profile=profile,
-            alerts=alerts,
-            soil_data=soil_data,
-            historical_comparison=historical,
+        results = await asyncio.gather(
+            get_historical_comparison(lat, lon, summary),
+            fetch_soil_moisture(lat, lon),
+            return_exceptions=True,
         )
-    except Exception as exc:
-        logger.warning("LLM advisory generation failed: %s", exc)
+        historical, soil_data = (
+            _enrichment_result(label, result)
+            for label, result in zip(
+                ("Historical comparison", "Soil moisture fetch"), results
+            )
+        )
+        ai_advisory = None
 
-    # 5. Build enriched crop profile for response
-    enriched_profile = {
-        "optimal_temp_range": f"{profile['optimal_temp_min']}-{profile['optimal_temp_max']}C",
-        "water_need": profile["water_need"],
-        "growth_season": profile["growth_season"],
-        "gujarat_varieties": profile.get("gujarat_varieties", []),
-        "soil_types_suitable": profile.get("soil_types_suitable", []),
-        "sowing_months": profile.get("sowing_months", []),
-        "harvest_months": profile.get("harvest_months", []),
-        "common_pests": profile.get("common_pests_gujarat", []),
-        "common_diseases": profile.get("common_diseases_gujarat", []),
-    }
+        # 4. Generate LLM advisory (uses the soil and historical data)
+        try:
+            ai_advisory = await generate_llm_advisory(
+                location=location or {"taluka": taluka, "district": district, "state": state},
+                forecast_summary=summary,
+                crop_type=crop_type,
+                crop_profile=profile,
+                alerts=alerts,
+                soil_data=soil_data,
+                historical_comparison=historical,
+            )
+        except Exception as exc:
+            logger.warning("LLM advisory generation failed: %s", exc)
 
-    # Include growth stages summary
-    growth_stages = profile.get("growth_stages", {})
-    if growth_stages:
-        enriched_profile["growth_stages"] = {
-            name: {
-                "duration_days": info["duration_days"],
-                "temp_range": f"{info['temp_min']}-{info['temp_max']}C",
-                "water_per_week": f"{info['water_mm_per_week']}mm",
-                "key_activity": info["key_activity"],
-            }
-            for name, info in growth_stages.items()
-        }
+        (govt_result,) = await asyncio.gather(govt_task, return_exceptions=True)
+        govt_advisory = _enrichment_result("Govt advisory fetch", govt_result)
+    finally:
+        govt_task.cancel()
 
     # Use AI advisory as primary recommendations if available,
     # fall back to rule-based
@@ -877,7 +1218,7 @@ async def analyze_crop_weather(
         "alerts": alerts,
         "overall_severity": determine_overall_severity(alerts),
         "recommendations": final_recommendations,
-        "crop_profile": enriched_profile,
+        "crop_profile": _enriched_profiles[crop_type],
         "historical_comparison": historical,
         "soil_data": soil_data,
         "govt_advisory": govt_advisory,
@@ -15,6 +15,9 @@ from app.utils.helpers import (
     sanitize_string,
     sanitize_query,
     haversine_distance,
+    haversine_distances_prepared,
+    prepare_point,
+    load_json_file,
 )
 from app.utils.exceptions import (
     AppException,
@@ -36,6 +39,9 @@ __all__ = [
     "sanitize_string",
     "sanitize_query",
     "haversine_distance",
+    "haversine_distances_prepared",
+    "prepare_point",
+    "load_json_file",
     # exceptions
     "AppException",
     "NotFoundError",
@@ -57,7 +57,8 @@ PINCODE_PATTERN = r"^\d{6}$"
 # ---------------------------------------------------------------------------
 # Supported Crop Types
 # ---------------------------------------------------------------------------
-SUPPORTED_CROPS = [
+# Display order for UI lists; use SUPPORTED_CROPS for membership checks.
+SUPPORTED_CROPS_DISPLAY = (
     "Paddy",
     "Wheat",
     "Cotton",
@@ -70,7 +71,8 @@ SUPPORTED_CROPS = [
     "Pulses",
     "Oilseeds",
     "Millets",
-]
+)
+SUPPORTED_CROPS = frozenset(SUPPORTED_CROPS_DISPLAY)
 
 # ---------------------------------------------------------------------------
 # Alert Severity Levels (ordered low -> high)
@@ -19,17 +19,27 @@ class AppException(Exception):
         error_code: Machine-readable error identifier (e.g. "DISEASE_NOT_FOUND").
         message: Human-readable error description.
         detail: Optional additional context.
+
+    Subclasses set the ``default_*`` class attributes instead of
+    re-passing their status, code and message through ``__init__``.
     """
 
+    default_status_code: int = 500
+    default_error_code: str = "INTERNAL_ERROR"
+    default_message: str = "An unexpected error occurred."
+
     def __init__(
         self,
-        status_code: int = 500,
-        error_code: str = "INTERNAL_ERROR",
-        message: str = "An unexpected error occurred.",
+        status_code: Optional[int] = None,
+        error_code: Optional[str] = None,
+        message: Optional[str] = None,
         detail: Optional[str] = None,
     ) -> None:
-        self.status_code = status_code
-        self.error_code = error_code
+        cls = type(self)
+        if message is None:
+            message = cls.default_message
+        self.status_code = cls.default_status_code if status_code is None else status_code
+        self.error_code = cls.default_error_code if error_code is None else error_code
         self.message = message
         self.detail = detail
         super().__init__(message)
@@ -45,86 +55,53 @@ class AppException(Exception):
         return payload
 
 
-class NotFoundError(AppException):
-    """Resource not found (HTTP 404)."""
+class _StatusError(AppException):
+    """Base for errors with a fixed HTTP status; ``message`` comes first."""
 
     def __init__(
         self,
-        message: str = "Requested resource not found.",
+        message: Optional[str] = None,
         detail: Optional[str] = None,
-        error_code: str = "NOT_FOUND",
+        error_code: Optional[str] = None,
     ) -> None:
-        super().__init__(
-            status_code=404,
-            error_code=error_code,
-            message=message,
-            detail=detail,
-        )
+        super().__init__(error_code=error_code, message=message, detail=detail)
+
+
+class NotFoundError(_StatusError):
+    """Resource not found (HTTP 404)."""
 
+    default_status_code = 404
+    default_error_code = "NOT_FOUND"
+    default_message = "Requested resource not found."
 
-class ValidationError(AppException):
+
+class ValidationError(_StatusError):
     """Input validation failure (HTTP 422)."""
 
-    def __init__(
-        self,
-        message: str = "Input validation failed.",
-        detail: Optional[str] = None,
-        error_code: str = "VALIDATION_ERROR",
-    ) -> None:
-        super().__init__(
-            status_code=422,
-            error_code=error_code,
-            message=message,
-            detail=detail,
-        )
+    default_status_code = 422
+    default_error_code = "VALIDATION_ERROR"
+    default_message = "Input validation failed."
 
 
-class ExternalAPIError(AppException):
+class ExternalAPIError(_StatusError):
     """External API call failure (HTTP 503)."""
 
-    def __init__(
-        self,
-        message: str = "External service is temporarily unavailable.",
-        detail: Optional[str] = None,
-        error_code: str = "EXTERNAL_API_ERROR",
-    ) -> None:
-        super().__init__(
-            status_code=503,
-            error_code=error_code,
-            message=message,
-            detail=detail,
-        )
+    default_status_code = 503
+    default_error_code = "EXTERNAL_API_ERROR"
+    default_message = "External service is temporarily unavailable."
 
 
-class RateLimitError(AppException):
+class RateLimitError(_StatusError):
     """Rate limit exceeded (HTTP 429)."""
 
-    def __init__(
-        self,
-        message: str = "Too many requests. Please try again later.",
-        detail: Optional[str] = None,
-        error_code: str = "RATE_LIMIT_EXCEEDED",
-    ) -> None:
-        super().__init__(
-            status_code=429,
-            error_code=error_code,
-            message=message,
-            detail=detail,
-        )
+    default_status_code = 429
+    default_error_code = "RATE_LIMIT_EXCEEDED"
+    default_message = "Too many requests. Please try again later."
 
 
-class DatabaseError(AppException):
+class DatabaseError(_StatusError):
     """Database operation failure (HTTP 500)."""
 
-    def __init__(
-        self,
-        message: str = "A database error occurred.",
-        detail: Optional[str] = None,
-        error_code: str = "DATABASE_ERROR",
-    ) -> None:
-        super().__init__(
-            status_code=500,
-            error_code=error_code,
-            message=message,
-            detail=detail,
-        )
+    default_status_code = 500
+    default_error_code = "DATABASE_ERROR"
+    default_message = "A database error occurred."
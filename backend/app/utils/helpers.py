@@ -6,15 +6,19 @@ Utility functions shared across the application:
 - Date/time helpers
 - String sanitisers
 - Distance calculator (Haversine)
-- JSON field serialization
+- JSON file loading and field serialization
 """
 
 import json
 import math
-import re
-import uuid
+import secrets
+import sys
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import orjson
 
 
 # ---------------------------------------------------------------------------
@@ -102,8 +106,8 @@ def build_pagination_meta(
 # ---------------------------------------------------------------------------
 
 def generate_request_id() -> str:
-    """Generate a unique request identifier (UUID4 hex, truncated to 12 chars)."""
-    return uuid.uuid4().hex[:12]
+    """Generate a unique request identifier (12 random hex chars)."""
+    return secrets.token_hex(6)
 
 
 # ---------------------------------------------------------------------------
@@ -115,6 +119,27 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+if sys.version_info >= (3, 11):
+    # 3.11+ accepts a trailing "Z" natively; no per-call string rewrite
+    _parse_iso = datetime.fromisoformat
+else:
+    def _parse_iso(value: str) -> datetime:
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+
+
+def parse_iso_datetime(value: str) -> datetime:
+    """
+    Parse an ISO-8601 timestamp, accepting a trailing ``Z`` for UTC.
+
+    Uses ``datetime.fromisoformat``, rewriting ``Z`` to ``+00:00`` only on
+    Python < 3.11, which lacks native support.  Raises ``ValueError`` for
+    malformed input.
+    """
+    return _parse_iso(value)
+
+
 def format_iso(dt: Optional[datetime]) -> Optional[str]:
     """Format a datetime as ISO-8601 string, or return None."""
     if dt is None:
@@ -126,12 +151,13 @@ def format_iso(dt: Optional[datetime]) -> Optional[str]:
 # String Sanitisation
 # ---------------------------------------------------------------------------
 
-_MULTI_SPACE = re.compile(r"\s+")
+# LIKE wildcards plus backslash, PostgreSQL's default LIKE escape character
+_LIKE_SPECIAL_CHARS = str.maketrans("", "", "%_\\")
 
 
 def sanitize_string(value: str) -> str:
     """Strip and collapse multiple whitespace characters."""
-    return _MULTI_SPACE.sub(" ", value.strip())
+    return " ".join(value.split())
 
 
 def sanitize_query(value: str) -> str:
@@ -139,9 +165,9 @@ def sanitize_query(value: str) -> str:
     Sanitise a search query: strip, collapse whitespace,
     and remove characters that could break LIKE clauses.
     """
-    cleaned = sanitize_string(value)
-    cleaned = cleaned.replace("%", "").replace("_", "")
-    return cleaned
+    # Remove the characters first so the collapse also covers the gaps
+    # they leave behind ("a % b" -> "a b", not "a  b").
+    return sanitize_string(value.translate(_LIKE_SPECIAL_CHARS))
 
 
 # ---------------------------------------------------------------------------
@@ -168,18 +194,60 @@ def haversine_distance(
     Returns:
         Distance in kilometres.
     """
-    lat1_r, lon1_r = math.radians(lat1), math.radians(lon1)
-    lat2_r, lon2_r = math.radians(lat2), math.radians(lon2)
+    lat1_r = math.radians(lat1)
+    lat2_r = math.radians(lat2)
+    half_dlat = math.sin((lat2_r - lat1_r) / 2)
+    half_dlon = math.sin(math.radians(lon2 - lon1) / 2)
+
+    a = half_dlat * half_dlat + math.cos(lat1_r) * math.cos(lat2_r) * half_dlon * half_dlon
+    # asin(sqrt(a)) equals atan2(sqrt(a), sqrt(1 - a)) for a in [0, 1] and
+    # saves a sqrt; min() guards against rounding pushing a just past 1.
+    return 2 * _EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+
+
+PreparedPoint = Tuple[float, float, float]
+
+
+def prepare_point(lat: float, lon: float) -> PreparedPoint:
+    """
+    Pre-convert a fixed location for repeated distance calculations.
+
+    Returns:
+        ``(lat_radians, lon_radians, cos(lat_radians))``.
+    """
+    lat_r = math.radians(lat)
+    return lat_r, math.radians(lon), math.cos(lat_r)
+
+
+def haversine_distances_prepared(
+    lat: float,
+    lon: float,
+    points: Iterable[PreparedPoint],
+) -> List[float]:
+    """
+    Distances from one reference point to many pre-converted points.
+
+    Points come from :func:`prepare_point`, so locations that never move
+    (e.g. market coordinates) pay their radians/cosine cost once at
+    import instead of on every request.
+
+    Args:
+        lat, lon: Latitude and longitude of the reference point (degrees).
+        points: Iterable of prepared points.
 
-    dlat = lat2_r - lat1_r
-    dlon = lon2_r - lon1_r
+    Returns:
+        Distances in kilometres, in the same order as ``points``.
+    """
+    lat_r, lon_r, cos_lat = prepare_point(lat, lon)
+    diameter = 2 * _EARTH_RADIUS_KM
 
-    a = (
-        math.sin(dlat / 2) ** 2
-        + math.cos(lat1_r) * math.cos(lat2_r) * math.sin(dlon / 2) ** 2
-    )
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-    return _EARTH_RADIUS_KM * c
+    distances: List[float] = []
+    for lat2_r, lon2_r, cos_lat2 in points:
+        half_dlat = math.sin((lat2_r - lat_r) / 2)
+        half_dlon = math.sin((lon2_r - lon_r) / 2)
+        a = half_dlat * half_dlat + cos_lat * cos_lat2 * half_dlon * half_dlon
+        distances.append(diameter * math.asin(math.sqrt(min(a, 1.0))))
+    return distances
 
 
 # ---------------------------------------------------------------------------
@@ -193,6 +261,11 @@ def clamp(value: float, min_val: float, max_val: float) -> float:
 
 def safe_float(value: Any, default: float = 0.0) -> float:
     """Safely convert a value to float, returning *default* on failure."""
+    # Fast paths for the common cases, avoiding the exception on None
+    if value is None:
+        return default
+    if type(value) is float:
+        return value
     try:
         return float(value)
     except (ValueError, TypeError):
@@ -204,6 +277,41 @@ def chunk_list(items: List[Any], size: int) -> List[List[Any]]:
     return [items[i : i + size] for i in range(0, len(items), size)]
 
 
+def iter_chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Lazily split any iterable into lists of at most ``size`` items.
+
+    Unlike :func:`chunk_list`, only one chunk is materialised at a time,
+    so batch loops over large inputs do not hold a second full copy.
+    """
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+# ---------------------------------------------------------------------------
+# JSON File Loading
+# ---------------------------------------------------------------------------
+
+def load_json_file(path: Union[str, Path]) -> Any:
+    """
+    Read and parse a UTF-8 JSON file with ``orjson``.
+
+    Parse errors raise ``orjson.JSONDecodeError``, a subclass of
+    ``json.JSONDecodeError``.
+    """
+    return orjson.loads(Path(path).read_bytes())
+
+
+def dump_json_bytes(value: Any) -> bytes:
+    """
+    Serialise *value* to compact UTF-8 JSON bytes with ``orjson``.
+
+    The output matches what the API's JSON responses render.
+    """
+    return orjson.dumps(value)
+
+
 # ---------------------------------------------------------------------------
 # JSON Field Serialization
 # ---------------------------------------------------------------------------
@@ -7,13 +7,59 @@ before insertion into the database.
 
 import json
 import logging
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+from app.utils.helpers import iter_chunks, load_json_file, parse_iso_datetime
+
 logger = logging.getLogger(__name__)
 
 
+# ---------------------------------------------------------------------------
+# Field rules (built once at import, walked by the validators below)
+# ---------------------------------------------------------------------------
+
+_DISEASE_REQUIRED_FIELDS = ("disease_name", "crop_type", "symptoms")
+
+# (field, rule, limit) in the order the checks run, so a record with
+# several problems always reports the same first error. Length rules skip
+# empty optional fields; the number rule skips only a missing value.
+_DISEASE_FIELD_RULES = (
+    ("disease_name", "max_length", 200),
+    ("disease_name_hindi", "max_length", 200),
+    ("crop_type", "max_length", 100),
+    ("symptoms", "min_length", 10),
+    ("dosage", "max_length", 500),
+    ("cost_per_acre", "non_negative", None),
+    ("image_url", "max_length", 500),
+    ("affected_stages", "max_length", 200),
+)
+
+_MANDI_REQUIRED_FIELDS = (
+    "commodity", "mandi_name", "state", "district", "price_per_quintal", "arrival_date",
+)
+_MANDI_MAX_LENGTHS = (
+    ("commodity", 100),
+    ("mandi_name", 200),
+    ("state", 100),
+    ("district", 100),
+)
+_MANDI_OPTIONAL_PRICE_FIELDS = ("min_price", "max_price", "modal_price")
+
+
+def _non_negative_float(value: Any, field: str) -> tuple[Optional[float], Optional[str]]:
+    """Parse ``value`` as a float >= 0, returning (number, error_message)."""
+    try:
+        number = float(value)
+    except (ValueError, TypeError):
+        return None, f"{field} must be a valid number"
+    if number < 0:
+        return None, f"{field} must be >= 0"
+    return number, None
+
+
 def validate_disease_data(disease: Dict[str, Any]) -> tuple[bool, Optional[str]]:
     """
     Validate a single disease record
@@ -24,45 +70,30 @@ def validate_disease_data(disease: Dict[str, Any]) -> tuple[bool, Optional[str]]
     Returns:
         Tuple of (is_valid, error_message)
     """
-    required_fields = ["disease_name", "crop_type", "symptoms"]
-    
+    get = disease.get
+
     # Check required fields
-    for field in required_fields:
-        if field not in disease or not disease[field]:
+    for field in _DISEASE_REQUIRED_FIELDS:
+        if not get(field):
             return False, f"Missing or empty required field: {field}"
     
-    # Validate field lengths
-    if len(disease["disease_name"]) > 200:
-        return False, "disease_name exceeds 200 characters"
-    
-    if disease.get("disease_name_hindi") and len(disease["disease_name_hindi"]) > 200:
-        return False, "disease_name_hindi exceeds 200 characters"
-    
-    if len(disease["crop_type"]) > 100:
-        return False, "crop_type exceeds 100 characters"
-    
-    if len(disease["symptoms"]) < 10:
-        return False, "symptoms must be at least 10 characters"
-    
-    if disease.get("dosage") and len(disease["dosage"]) > 500:
-        return False, "dosage exceeds 500 characters"
-    
-    # Validate cost
-    if disease.get("cost_per_acre") is not None:
-        try:
-            cost = float(disease["cost_per_acre"])
-            if cost < 0:
-                return False, "cost_per_acre must be >= 0"
-        except (ValueError, TypeError):
-            return False, "cost_per_acre must be a valid number"
-    
-    # Validate image_url length
-    if disease.get("image_url") and len(disease["image_url"]) > 500:
-        return False, "image_url exceeds 500 characters"
-    
-    # Validate affected_stages length
-    if disease.get("affected_stages") and len(disease["affected_stages"]) > 200:
-        return False, "affected_stages exceeds 200 characters"
+    # Validate field lengths and cost
+    for field, rule, limit in _DISEASE_FIELD_RULES:
+        value = get(field)
+        if rule == "non_negative":
+            if value is not None:
+                _, error = _non_negative_float(value, field)
+                if error:
+                    return False, error
+            continue
+        if not value:
+            continue
+        if not isinstance(value, str):
+            return False, f"{field} must be a string"
+        if rule == "max_length" and len(value) > limit:
+            return False, f"{field} exceeds {limit} characters"
+        if rule == "min_length" and len(value) < limit:
+            return False, f"{field} must be at least {limit} characters"
     
     return True, None
 
@@ -77,61 +108,52 @@ def validate_mandi_price_data(price: Dict[str, Any]) -> tuple[bool, Optional[str
     Returns:
         Tuple of (is_valid, error_message)
     """
-    required_fields = ["commodity", "mandi_name", "state", "district", "price_per_quintal", "arrival_date"]
-    
     # Check required fields
-    for field in required_fields:
+    for field in _MANDI_REQUIRED_FIELDS:
         if field not in price:
             return False, f"Missing required field: {field}"
     
     # Validate field lengths
-    if len(price["commodity"]) > 100:
-        return False, "commodity exceeds 100 characters"
-    
-    if len(price["mandi_name"]) > 200:
-        return False, "mandi_name exceeds 200 characters"
-    
-    if len(price["state"]) > 100:
-        return False, "state exceeds 100 characters"
-    
-    if len(price["district"]) > 100:
-        return False, "district exceeds 100 characters"
-    
-    # Validate prices
-    try:
-        price_per_quintal = float(price["price_per_quintal"])
-        if price_per_quintal < 0:
-            return False, "price_per_quintal must be >= 0"
-    except (ValueError, TypeError):
-        return False, "price_per_quintal must be a valid number"
-    
-    # Validate optional prices
-    for price_field in ["min_price", "max_price", "modal_price"]:
-        if price.get(price_field) is not None:
-            try:
-                price_val = float(price[price_field])
-                if price_val < 0:
-                    return False, f"{price_field} must be >= 0"
-            except (ValueError, TypeError):
-                return False, f"{price_field} must be a valid number"
-    
+    for field, max_length in _MANDI_MAX_LENGTHS:
+        value = price[field]
+        if not isinstance(value, str):
+            return False, f"{field} must be a string"
+        if len(value) > max_length:
+            return False, f"{field} exceeds {max_length} characters"
+    
+    # Validate prices (each parsed once and reused for the range checks)
+    _, error = _non_negative_float(price["price_per_quintal"], "price_per_quintal")
+    if error:
+        return False, error
+
+    parsed: Dict[str, Optional[float]] = {}
+    for field in _MANDI_OPTIONAL_PRICE_FIELDS:
+        if (value := price.get(field)) is None:
+            parsed[field] = None
+            continue
+        parsed[field], error = _non_negative_float(value, field)
+        if error:
+            return False, error
+
+    min_price = parsed["min_price"]
+    max_price = parsed["max_price"]
+    modal_price = parsed["modal_price"]
+
     # Validate max_price >= min_price if both present
-    if price.get("min_price") is not None and price.get("max_price") is not None:
-        if float(price["max_price"]) < float(price["min_price"]):
-            return False, "max_price must be >= min_price"
+    if min_price is not None and max_price is not None and max_price < min_price:
+        return False, "max_price must be >= min_price"
     
-    # Validate modal_price range if present
-    if price.get("modal_price") is not None:
-        modal = float(price["modal_price"])
-        if price.get("min_price") and modal < float(price["min_price"]):
+    # Validate modal_price range if present (falsy bounds are not enforced)
+    if modal_price is not None:
+        if price.get("min_price") and modal_price < min_price:
             return False, "modal_price must be >= min_price"
-        if price.get("max_price") and modal > float(price["max_price"]):
+        if price.get("max_price") and modal_price > max_price:
             return False, "modal_price must be <= max_price"
     
     # Validate arrival_date
     try:
         if isinstance(price["arrival_date"], str):
-            datetime.fromisoformat(price["arrival_date"].replace("Z", "+00:00"))
+            parse_iso_datetime(price["arrival_date"])
     except (ValueError, AttributeError):
         return False, "arrival_date must be a valid ISO format datetime string"
     
@@ -167,6 +189,64 @@ def validate_weather_alert_data(alert: Dict[str, Any]) -> tuple[bool, Optional[s
     return True, None
 
 
+# Record counts at which validation fans out across worker processes; below
+# this, pool start-up costs more than validating serially in-process.
+_PARALLEL_VALIDATION_MIN_RECORDS = 50_000
+_PARALLEL_VALIDATION_BATCH_SIZE = 2_000
+
+
+def _validate_batch(
+    validator_func, start: int, records: List[Any]
+) -> tuple[List[str], int]:
+    """Validate one batch; ``start`` is the batch's offset for error numbering."""
+    errors = []
+    valid_count = 0
+    for idx, record in enumerate(records, start=start + 1):
+        is_valid, error_msg = validator_func(record)
+        if not is_valid:
+            errors.append(f"Record {idx}: {error_msg}")
+        else:
+            valid_count += 1
+    return errors, valid_count
+
+
+def _validate_records(data: Any, validator_func) -> tuple[bool, List[str], int]:
+    """Apply ``validator_func`` to every record of already-parsed JSON data."""
+    if not isinstance(data, list):
+        return False, ["JSON file must contain an array"], 0
+
+    if len(data) < _PARALLEL_VALIDATION_MIN_RECORDS:
+        errors, valid_count = _validate_batch(validator_func, 0, data)
+        return len(errors) == 0, errors, valid_count
+
+    size = _PARALLEL_VALIDATION_BATCH_SIZE
+    starts = range(0, len(data), size)
+    errors = []
+    valid_count = 0
+    with ProcessPoolExecutor() as pool:
+        for batch_errors, batch_valid in pool.map(
+            _validate_batch,
+            repeat(validator_func),
+            starts,
+            iter_chunks(data, size),
+        ):
+            errors.extend(batch_errors)
+            valid_count += batch_valid
+    return len(errors) == 0, errors, valid_count
+
+
+def _read_json(file_path: Path) -> tuple[Any, List[str]]:
+    """Parse ``file_path`` once, returning (data, error_messages)."""
+    try:
+        return load_json_file(file_path), []
+    except json.JSONDecodeError as e:
+        return None, [f"Invalid JSON: {str(e)}"]
+    except FileNotFoundError:
+        return None, [f"File not found: {file_path}"]
+    except Exception as e:
+        return None, [f"Error reading file: {str(e)}"]
+
+
 def validate_json_file(file_path: Path, validator_func) -> tuple[bool, List[str], int]:
     """
     Validate all records in a JSON file
@@ -178,31 +258,24 @@ def validate_json_file(file_path: Path, validator_func) -> tuple[bool, List[str]
     Returns:
         Tuple of (all_valid, error_messages, valid_count)
     """
-    errors = []
-    valid_count = 0
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        if not isinstance(data, list):
-            return False, ["JSON file must contain an array"], 0
-        
-        for idx, record in enumerate(data):
-            is_valid, error_msg = validator_func(record)
-            if not is_valid:
-                errors.append(f"Record {idx + 1}: {error_msg}")
-            else:
-                valid_count += 1
-        
-        return len(errors) == 0, errors, valid_count
-        
-    except json.JSONDecodeError as e:
-        return False, [f"Invalid JSON: {str(e)}"], 0
-    except FileNotFoundError:
-        return False, [f"File not found: {file_path}"], 0
-    except Exception as e:
-        return False, [f"Error reading file: {str(e)}"], 0
+    data, errors = _read_json(file_path)
+    if errors:
+        return False, errors, 0
+    return _validate_records(data, validator_func)
+
+
+def _load_and_validate(
+    file_path: Path, validator_func, label: str
+) -> tuple[bool, List[Dict], List[str]]:
+    """Read ``file_path`` once, validate it and return the parsed records."""
+    data, errors = _read_json(file_path)
+    if not errors:
+        is_valid, errors, count = _validate_records(data, validator_func)
+        if is_valid:
+            logger.info(f"Loaded and validated {count} {label} records")
+            return True, data, []
+    logger.error(f"Validation failed for {file_path.name}: {errors}")
+    return False, [], errors
 
 
 def load_and_validate_diseases(data_dir: Path) -> tuple[bool, List[Dict], List[str]]:
@@ -215,17 +288,7 @@ def load_and_validate_diseases(data_dir: Path) -> tuple[bool, List[Dict], List[s
     Returns:
         Tuple of (is_valid, diseases_list, error_messages)
     """
-    file_path = data_dir / "diseases.json"
-    is_valid, errors, count = validate_json_file(file_path, validate_disease_data)
-    
-    if is_valid:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            diseases = json.load(f)
-        logger.info(f"Loaded and validated {count} disease records")
-        return True, diseases, []
-    else:
-        logger.error(f"Validation failed for diseases.json: {errors}")
-        return False, [], errors
+    return _load_and_validate(data_dir / "diseases.json", validate_disease_data, "disease")
 
 
 def load_and_validate_mandi_prices(data_dir: Path) -> tuple[bool, List[Dict], List[str]]:
@@ -238,17 +301,9 @@ def load_and_validate_mandi_prices(data_dir: Path) -> tuple[bool, List[Dict], Li
     Returns:
         Tuple of (is_valid, prices_list, error_messages)
     """
-    file_path = data_dir / "mandi_prices.json"
-    is_valid, errors, count = validate_json_file(file_path, validate_mandi_price_data)
-    
-    if is_valid:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            prices = json.load(f)
-        logger.info(f"Loaded and validated {count} mandi price records")
-        return True, prices, []
-    else:
-        logger.error(f"Validation failed for mandi_prices.json: {errors}")
-        return False, [], errors
+    return _load_and_validate(
+        data_dir / "mandi_prices.json", validate_mandi_price_data, "mandi price"
+    )
 
 
 def load_and_validate_weather_alerts(data_dir: Path) -> tuple[bool, List[Dict], List[str]]:
@@ -261,14 +316,6 @@ def load_and_validate_weather_alerts(data_dir: Path) -> tuple[bool, List[Dict],
     Returns:
         Tuple of (is_valid, alerts_list, error_messages)
     """
-    file_path = data_dir / "weather_alerts.json"
-    is_valid, errors, count = validate_json_file(file_path, validate_weather_alert_data)
-    
-    if is_valid:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            alerts = json.load(f)
-        logger.info(f"Loaded and validated {count} weather alert records")
-        return True, alerts, []
-    else:
-        logger.error(f"Validation failed for weather_alerts.json: {errors}")
-        return False, [], errors
+    return _load_and_validate(
+        data_dir / "weather_alerts.json", validate_weather_alert_data, "weather alert"
+    )
@@ -8,17 +8,22 @@ This script initializes the database by:
 4. Verifying data insertion
 """
 
+import io
 import sys
 import logging
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from sqlalchemy.exc import SQLAlchemyError
+from pathlib import Path
+from sqlalchemy import func, insert, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from app.database import init_db, get_db_context, check_db_connection, Base, engine
 from app.models import DiseaseTreatment, WeatherCache, MandiPrice
+from app.utils.helpers import iter_chunks, parse_iso_datetime
 from app.utils.validators import (
     load_and_validate_diseases,
     load_and_validate_mandi_prices,
@@ -45,8 +50,187 @@ def create_tables():
         return False
 
 
-def load_diseases(data_dir: Path):
-    """Load and insert disease data"""
+# Rows per executemany batch; matches SQLAlchemy's insertmanyvalues page size
+INSERT_BATCH_SIZE = 1000
+
+
+def group_rows(model, records, label_field):
+    """
+    Group records by their key set for executemany and COPY, which need
+    every row in a statement to carry the same keys.
+    
+    Keys a record omits stay unset, so column defaults still apply to it
+    instead of an explicit NULL. Records with keys that are not columns of
+    *model* are skipped with a warning, as the ORM constructor rejected them.
+    
+    Returns:
+        Dict of sorted column-name tuple -> list of records with those keys
+    """
+    columns = set(model.__table__.columns.keys())
+    groups = {}
+    for record in records:
+        unknown = record.keys() - columns
+        if unknown:
+            logger.warning(
+                f"Skipping '{record.get(label_field, 'unknown')}': "
+                f"not columns of {model.__tablename__}: {', '.join(sorted(unknown))}"
+            )
+            continue
+        groups.setdefault(tuple(sorted(record)), []).append(record)
+    return groups
+
+
+def _insert_groups(db, model, groups, label_field):
+    """Insert pre-grouped records with executemany (see bulk_insert)"""
+    statement = insert(model)
+    
+    inserted = 0
+    for rows in groups.values():
+        for batch in iter_chunks(rows, INSERT_BATCH_SIZE):
+            try:
+                db.execute(statement, batch)
+                db.commit()
+                inserted += len(batch)
+                continue
+            except IntegrityError as e:
+                db.rollback()
+                logger.warning(f"Batch insert into {model.__tablename__} failed, retrying row by row: {e.orig}")
+            
+            for row in batch:
+                try:
+                    db.execute(statement, row)
+                    db.commit()
+                    inserted += 1
+                except IntegrityError as e:
+                    db.rollback()
+                    logger.warning(f"Error inserting '{row.get(label_field, 'unknown')}': {e.orig}")
+    return inserted
+
+
+def bulk_insert(db, model, records, label_field):
+    """
+    Insert records with Core executemany in batches of INSERT_BATCH_SIZE,
+    falling back to row-by-row inserts on IntegrityError so one bad record
+    does not lose the whole batch.
+    
+    Returns:
+        Number of records inserted
+    """
+    return _insert_groups(db, model, group_rows(model, records, label_field), label_field)
+
+
+# Backslash escapes for PostgreSQL COPY text format
+_COPY_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_text_value(value) -> str:
+    """Render one value as a COPY text-format field (\\N for NULL)"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value).translate(_COPY_TEXT_ESCAPES)
+
+
+def copy_insert(db, model, records, label_field):
+    """
+    Load records with PostgreSQL COPY FROM STDIN when running on psycopg2,
+    which skips per-statement parsing and planning entirely. Each key set
+    gets its own COPY, so omitted columns keep their defaults.
+    
+    Falls back to bulk_insert on other databases, or if COPY fails (e.g. a
+    constraint violation), so bad rows are still isolated one by one.
+    
+    Returns:
+        Number of records inserted
+    """
+    if engine.dialect.driver != "psycopg2":
+        return bulk_insert(db, model, records, label_field)
+    
+    groups = group_rows(model, records, label_field)
+    try:
+        cursor = db.connection().connection.cursor()
+        try:
+            for keys, rows in groups.items():
+                buffer = io.StringIO()
+                for row in rows:
+                    buffer.write("\t".join(_copy_text_value(row[key]) for key in keys))
+                    buffer.write("\n")
+                buffer.seek(0)
+                cursor.copy_expert(
+                    f"COPY {model.__tablename__} ({', '.join(keys)}) FROM STDIN",
+                    buffer,
+                )
+        finally:
+            cursor.close()
+        db.commit()
+        return sum(len(rows) for rows in groups.values())
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"COPY into {model.__tablename__} failed, falling back to INSERT: {e}")
+        return _insert_groups(db, model, groups, label_field)
+
+
+@contextmanager
+def without_secondary_indexes(tables):
+    """
+    Drop the non-unique indexes declared on *tables* for the duration of a
+    bulk load and rebuild them afterwards (also when the load fails).
+    
+    Building an index once over the loaded rows is much cheaper than
+    updating every index on each insert. Unique indexes are left in place
+    so duplicate rows are still rejected during the load.
+    """
+    indexes = [index for table in tables for index in table.indexes if not index.unique]
+    with engine.begin() as conn:
+        for index in indexes:
+            index.drop(bind=conn, checkfirst=True)
+    logger.info(f"Dropped {len(indexes)} secondary indexes for bulk load")
+    try:
+        yield
+    finally:
+        with engine.begin() as conn:
+            for index in indexes:
+                index.create(bind=conn, checkfirst=True)
+        logger.info(f"Rebuilt {len(indexes)} secondary indexes")
+
+
+# Smaller loads keep their indexes: dropping and rebuilding them costs more
+# than updating them row by row.
+INDEX_REBUILD_MIN_ROWS = 10_000
+
+
+def insert_rows(db, model, records, label_field, insert_fn=bulk_insert):
+    """
+    Insert records into an empty table with *insert_fn*, dropping the
+    table's secondary indexes around loads of INDEX_REBUILD_MIN_ROWS or
+    more on server databases.
+    
+    Returns:
+        Number of records inserted
+    """
+    if engine.dialect.name == "sqlite" or len(records) < INDEX_REBUILD_MIN_ROWS:
+        return insert_fn(db, model, records, label_field)
+    
+    # End the read transaction so DROP INDEX is not blocked by its locks
+    db.commit()
+    with without_secondary_indexes([model.__table__]):
+        return insert_fn(db, model, records, label_field)
+
+
+def table_has_rows(db, model) -> bool:
+    """Return True if *model*'s table holds at least one row (EXISTS, no full count)"""
+    return db.query(db.query(model).exists()).scalar()
+
+
+def load_diseases(db, data_dir: Path):
+    """
+    Load and insert disease data
+    
+    Returns:
+        (success, records inserted); 0 when the table was already populated.
+        Table totals are counted once, in verify_data.
+    """
     try:
         is_valid, diseases, errors = load_and_validate_diseases(data_dir)
         
@@ -58,35 +242,30 @@ def load_diseases(data_dir: Path):
             logger.warning("No diseases to load")
             return True, 0
         
-        with get_db_context() as db:
-            # Check if diseases already exist
-            existing_count = db.query(DiseaseTreatment).count()
-            if existing_count > 0:
-                logger.info(f"Found {existing_count} existing disease records. Skipping insertion.")
-                return True, existing_count
-            
-            # Insert diseases
-            inserted = 0
-            for disease in diseases:
-                try:
-                    disease_obj = DiseaseTreatment(**disease)
-                    db.add(disease_obj)
-                    inserted += 1
-                except Exception as e:
-                    logger.warning(f"Error inserting disease '{disease.get('disease_name', 'unknown')}': {str(e)}")
-                    continue
-            
-            db.commit()
-            logger.info(f"Successfully inserted {inserted} disease records")
-            return True, inserted
-            
+        # Check if diseases already exist
+        if table_has_rows(db, DiseaseTreatment):
+            logger.info("Disease table already populated. Skipping insertion.")
+            return True, 0
+        
+        # Insert diseases
+        inserted = insert_rows(db, DiseaseTreatment, diseases, "disease_name")
+        logger.info(f"Successfully inserted {inserted} disease records")
+        return True, inserted
+        
     except Exception as e:
+        db.rollback()
         logger.error(f"Error loading diseases: {str(e)}")
         return False, 0
 
 
-def load_mandi_prices(data_dir: Path):
-    """Load and insert mandi price data"""
+def load_mandi_prices(db, data_dir: Path):
+    """
+    Load and insert mandi price data
+    
+    Returns:
+        (success, records inserted); 0 when the table was already populated.
+        Table totals are counted once, in verify_data.
+    """
     try:
         is_valid, prices, errors = load_and_validate_mandi_prices(data_dir)
         
@@ -98,69 +277,95 @@ def load_mandi_prices(data_dir: Path):
             logger.warning("No mandi prices to load")
             return True, 0
         
-        with get_db_context() as db:
-            # Check if prices already exist
-            existing_count = db.query(MandiPrice).count()
-            if existing_count > 0:
-                logger.info(f"Found {existing_count} existing mandi price records. Skipping insertion.")
-                return True, existing_count
-            
-            # Insert prices
-            inserted = 0
-            for price in prices:
-                try:
-                    # Convert arrival_date string to datetime if needed
-                    if isinstance(price.get("arrival_date"), str):
-                        price["arrival_date"] = datetime.fromisoformat(
-                            price["arrival_date"].replace("Z", "+00:00")
-                        )
-                    
-                    price_obj = MandiPrice(**price)
-                    db.add(price_obj)
-                    inserted += 1
-                except Exception as e:
-                    logger.warning(f"Error inserting price for '{price.get('commodity', 'unknown')}': {str(e)}")
-                    continue
-            
-            db.commit()
-            logger.info(f"Successfully inserted {inserted} mandi price records")
-            return True, inserted
-            
+        # Check if prices already exist
+        if table_has_rows(db, MandiPrice):
+            logger.info("Mandi price table already populated. Skipping insertion.")
+            return True, 0
+        
+        # Convert arrival_date strings to datetimes (validated upstream)
+        for price in prices:
+            if isinstance(price.get("arrival_date"), str):
+                price["arrival_date"] = parse_iso_datetime(price["arrival_date"])
+        
+        # Insert prices
+        inserted = insert_rows(db, MandiPrice, prices, "commodity", copy_insert)
+        logger.info(f"Successfully inserted {inserted} mandi price records")
+        return True, inserted
+        
     except Exception as e:
+        db.rollback()
         logger.error(f"Error loading mandi prices: {str(e)}")
         return False, 0
 
 
-def verify_data():
+def run_load_phases(db, data_dir: Path) -> bool:
+    """
+    Run the disease and mandi price loads, returning False if either failed.
+    
+    The phases write disjoint tables, so on pooled server databases they run
+    concurrently, each on its own session. SQLite allows a single writer, so
+    there they run in turn on the shared session *db*.
+    """
+    phases = (("diseases", load_diseases), ("mandi prices", load_mandi_prices))
+    
+    if engine.dialect.name == "sqlite":
+        results = [loader(db, data_dir) for _, loader in phases]
+    else:
+        def run_phase(loader):
+            with get_db_context() as phase_db:
+                return loader(phase_db, data_dir)
+        
+        with ThreadPoolExecutor(max_workers=len(phases)) as executor:
+            results = list(executor.map(run_phase, (loader for _, loader in phases)))
+    
+    ok = True
+    for (label, _), (success, _) in zip(phases, results):
+        if not success:
+            logger.error(f"Failed to load {label}")
+            ok = False
+    return ok
+
+
+def verify_data(db):
     """Verify data was inserted correctly"""
     try:
-        with get_db_context() as db:
-            disease_count = db.query(DiseaseTreatment).count()
-            price_count = db.query(MandiPrice).count()
-            
-            logger.info(f"Data verification:")
-            logger.info(f"  - Diseases: {disease_count}")
-            logger.info(f"  - Mandi Prices: {price_count}")
-            
-            # Verify expected counts
-            if disease_count < 30:
-                logger.warning(f"Expected at least 30 diseases, found {disease_count}")
-            
-            if price_count < 50:
-                logger.warning(f"Expected at least 50 mandi prices, found {price_count}")
-            
-            # Sample verification - check a few records
-            sample_disease = db.query(DiseaseTreatment).first()
-            if sample_disease:
-                logger.info(f"Sample disease: {sample_disease.disease_name} ({sample_disease.crop_type})")
-            
-            sample_price = db.query(MandiPrice).first()
-            if sample_price:
-                logger.info(f"Sample price: {sample_price.commodity} @ {sample_price.price_per_quintal} INR/qnt")
-            
-            return disease_count, price_count
-            
+        # Both counts in one round trip via scalar subqueries
+        disease_count, price_count = db.execute(
+            select(
+                select(func.count()).select_from(DiseaseTreatment).scalar_subquery(),
+                select(func.count()).select_from(MandiPrice).scalar_subquery(),
+            )
+        ).one()
+        
+        logger.info(f"Data verification:")
+        logger.info(f"  - Diseases: {disease_count}")
+        logger.info(f"  - Mandi Prices: {price_count}")
+        
+        # Verify expected counts
+        if disease_count < 30:
+            logger.warning(f"Expected at least 30 diseases, found {disease_count}")
+        
+        if price_count < 50:
+            logger.warning(f"Expected at least 50 mandi prices, found {price_count}")
+        
+        # Sample verification - check a few records
+        # Project only the columns logged instead of loading full rows
+        sample_disease = db.query(
+            DiseaseTreatment.disease_name, DiseaseTreatment.crop_type
+        ).first()
+        if sample_disease:
+            logger.info(f"Sample disease: {sample_disease.disease_name} ({sample_disease.crop_type})")
+        
+        sample_price = db.query(
+            MandiPrice.commodity, MandiPrice.price_per_quintal
+        ).first()
+        if sample_price:
+            logger.info(f"Sample price: {sample_price.commodity} @ {sample_price.price_per_quintal} INR/qnt")
+        
+        return disease_count, price_count
+        
     except Exception as e:
+        db.rollback()
         logger.error(f"Error verifying data: {str(e)}")
         return 0, 0
 
@@ -193,29 +398,21 @@ def main():
         logger.error("Failed to create tables")
         sys.exit(1)
     
-    # Step 2: Load diseases
-    logger.info("\n" + "-" * 60)
-    logger.info("Loading diseases...")
-    success, disease_count = load_diseases(data_dir)
-    if not success:
-        logger.error("Failed to load diseases")
-        sys.exit(1)
-    
-    # Step 3: Load mandi prices
-    logger.info("\n" + "-" * 60)
-    logger.info("Loading mandi prices...")
-    success, price_count = load_mandi_prices(data_dir)
-    if not success:
-        logger.error("Failed to load mandi prices")
-        sys.exit(1)
+    # Shared session for verification and, on SQLite, the load phases too
+    with get_db_context() as db:
+        # Steps 2-3: Load diseases and mandi prices
+        logger.info("\n" + "-" * 60)
+        logger.info("Loading diseases and mandi prices...")
+        if not run_load_phases(db, data_dir):
+            sys.exit(1)
     
-    # Note: Weather alerts are loaded dynamically by the weather service
-    # They don't need to be stored in the database
+        # Note: Weather alerts are loaded dynamically by the weather service
+        # They don't need to be stored in the database
     
-    # Step 4: Verify data
-    logger.info("\n" + "-" * 60)
-    logger.info("Verifying data...")
-    final_disease_count, final_price_count = verify_data()
+        # Step 4: Verify data
+        logger.info("\n" + "-" * 60)
+        logger.info("Verifying data...")
+        final_disease_count, final_price_count = verify_data(db)
     
     # Summary
     logger.info("\n" + "=" * 60)
@@ -11,6 +11,8 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from random import uniform, choice
 
+from sqlalchemy import delete, insert
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -56,20 +58,24 @@ def seed_additional_diseases():
     
     try:
         with get_db_context() as db:
-            inserted = 0
+            # Fetch the names that already exist in one query
+            candidate_names = [d["disease_name"] for d in additional_diseases]
+            existing = {
+                name for (name,) in db.query(DiseaseTreatment.disease_name).filter(
+                    DiseaseTreatment.disease_name.in_(candidate_names)
+                )
+            }
+            
+            to_insert = []
             for disease in additional_diseases:
-                # Check if already exists
-                existing = db.query(DiseaseTreatment).filter(
-                    DiseaseTreatment.disease_name == disease["disease_name"]
-                ).first()
-                
-                if existing:
+                if disease["disease_name"] in existing:
                     logger.info(f"Disease '{disease['disease_name']}' already exists, skipping")
                     continue
-                
-                disease_obj = DiseaseTreatment(**disease)
-                db.add(disease_obj)
-                inserted += 1
+                to_insert.append(disease)
+            
+            if to_insert:
+                db.execute(insert(DiseaseTreatment), to_insert)
+            inserted = len(to_insert)
             
             db.commit()
             logger.info(f"Inserted {inserted} additional disease records")
@@ -79,60 +85,63 @@ def seed_additional_diseases():
         return 0
 
 
-def seed_additional_mandi_prices():
-    """Add additional test mandi prices with recent dates"""
-    commodities = ["Wheat", "Rice", "Cotton", "Sugarcane", "Onion", "Tomato", "Potato"]
-    states = ["Punjab", "Haryana", "Uttar Pradesh", "Maharashtra", "Gujarat"]
-    districts = {
+# Representative modal prices (INR/quintal) used to generate test records
+BASE_PRICES = {
+    "Wheat": 2200,
+    "Rice": 1850,
+    "Cotton": 7200,
+    "Sugarcane": 315,
+    "Onion": 2800,
+    "Tomato": 1200,
+    "Potato": 800
+}
+COMMODITIES = tuple(BASE_PRICES)
+
+STATE_DISTRICTS = tuple(
+    (state, district)
+    for state, districts in {
         "Punjab": ["Ludhiana", "Amritsar", "Jalandhar", "Bathinda"],
         "Haryana": ["Karnal", "Sonipat", "Rohtak", "Hisar"],
         "Uttar Pradesh": ["Meerut", "Aligarh", "Agra", "Kanpur"],
         "Maharashtra": ["Pune", "Nashik", "Ahmednagar", "Kolhapur"],
         "Gujarat": ["Ahmedabad", "Surat", "Rajkot", "Vadodara"]
-    }
-    
+    }.items()
+    for district in districts
+)
+
+
+def seed_additional_mandi_prices(count: int = 10):
+    """Add additional test mandi prices with recent dates"""
     try:
         with get_db_context() as db:
-            inserted = 0
-            base_date = datetime.now()
+            one_day = timedelta(days=1)
+            arrival_date = datetime.now()
+            rows = []
             
-            for i in range(10):  # Add 10 additional price records
-                commodity = choice(commodities)
-                state = choice(states)
-                district = choice(districts[state])
+            for _ in range(count):
+                commodity = choice(COMMODITIES)
+                state, district = choice(STATE_DISTRICTS)
                 
                 # Generate realistic prices based on commodity
-                base_prices = {
-                    "Wheat": 2200,
-                    "Rice": 1850,
-                    "Cotton": 7200,
-                    "Sugarcane": 315,
-                    "Onion": 2800,
-                    "Tomato": 1200,
-                    "Potato": 800
-                }
-                
-                base_price = base_prices[commodity]
+                base_price = BASE_PRICES[commodity]
                 price_per_quintal = round(uniform(base_price * 0.95, base_price * 1.05), 2)
-                min_price = round(price_per_quintal * 0.95, 2)
-                max_price = round(price_per_quintal * 1.05, 2)
-                modal_price = round(price_per_quintal, 2)
                 
-                price_data = {
+                rows.append({
                     "commodity": commodity,
                     "mandi_name": f"{district} Test Mandi",
                     "state": state,
                     "district": district,
                     "price_per_quintal": price_per_quintal,
-                    "arrival_date": base_date - timedelta(days=i),
-                    "min_price": min_price,
-                    "max_price": max_price,
-                    "modal_price": modal_price
-                }
-                
-                price_obj = MandiPrice(**price_data)
-                db.add(price_obj)
-                inserted += 1
+                    "arrival_date": arrival_date,
+                    "min_price": round(price_per_quintal * 0.95, 2),
+                    "max_price": round(price_per_quintal * 1.05, 2),
+                    "modal_price": price_per_quintal  # already rounded
+                })
+                arrival_date -= one_day
+            
+            if rows:
+                db.execute(insert(MandiPrice), rows)
+            inserted = len(rows)
             
             db.commit()
             logger.info(f"Inserted {inserted} additional mandi price records")
@@ -146,21 +155,18 @@ def clear_test_data():
     """Remove test data (diseases and prices with 'Test' in name)"""
     try:
         with get_db_context() as db:
-            # Remove test diseases
-            test_diseases = db.query(DiseaseTreatment).filter(
-                DiseaseTreatment.disease_name.like("%Test%")
-            ).all()
-            disease_count = len(test_diseases)
-            for disease in test_diseases:
-                db.delete(disease)
-            
-            # Remove test mandi prices
-            test_prices = db.query(MandiPrice).filter(
-                MandiPrice.mandi_name.like("%Test%")
-            ).all()
-            price_count = len(test_prices)
-            for price in test_prices:
-                db.delete(price)
+            # Remove test diseases and prices with one DELETE per table; the
+            # session holds no loaded objects, so skip identity-map syncing
+            disease_count = db.execute(
+                delete(DiseaseTreatment)
+                .where(DiseaseTreatment.disease_name.like("%Test%"))
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            price_count = db.execute(
+                delete(MandiPrice)
+                .where(MandiPrice.mandi_name.like("%Test%"))
+                .execution_options(synchronize_session=False)
+            ).rowcount
             
             db.commit()
             logger.info(f"Removed {disease_count} test diseases and {price_count} test prices")
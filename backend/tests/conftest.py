@@ -8,19 +8,34 @@ Provides:
 """
 
 import json
-import sys
+import os
 from datetime import datetime, timedelta, timezone
-from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from functools import lru_cache
+from types import MappingProxyType
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import StaticPool
+from orjson import loads as _json_loads
+
+# Shared-cache in-memory database: nothing touches the filesystem. StaticPool
+# keeps the single connection (and with it the database) alive for the whole
+# session; NullPool would open a fresh, empty database on every checkout.
+# Under pytest-xdist (``pytest -n auto --dist loadfile``) each worker names
+# its own database and seeds it in ``pytest_sessionstart``.
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+TEST_DATABASE_URL = (
+    f"sqlite:///file:farmhelp_{_XDIST_WORKER}?mode=memory&cache=shared&uri=true"
+)
 
-# Ensure the backend package is importable
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+# Settings are read when the app is imported: lift the rate limit so the
+# 126+ tests in a single session are never throttled, and point the app's
+# own engine (used by the startup hook) at this worker's test database
+# rather than ./farmhelp.db, which parallel workers would race to create.
+os.environ["RATE_LIMIT_PER_MINUTE"] = "999999"
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL
 
 from app.database import Base, get_db
 from app.main import app
@@ -31,68 +46,108 @@ from app.models import DiseaseTreatment, MandiPrice, WeatherCache
 # Test Database Setup
 # ---------------------------------------------------------------------------
 
-TEST_DATABASE_URL = "sqlite:///./test_farmhelp.db"
 
 engine = create_engine(
     TEST_DATABASE_URL,
-    poolclass=NullPool,
+    poolclass=StaticPool,
     connect_args={"check_same_thread": False},
 )
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@event.listens_for(engine, "connect")
+def _set_test_sqlite_pragmas(dbapi_conn, connection_record):
+    """Throwaway data: skip journaling and syncs, keep temp tables in RAM."""
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+    cursor.close()
+
+
+# One Session serves every request; TestClient calls are sequential, so
+# it is never used by two requests at once.
+_request_session = TestingSessionLocal()
+
+
 def override_get_db():
-    db = TestingSessionLocal()
     try:
-        yield db
+        yield _request_session
     finally:
-        db.close()
+        # End the request's transaction; this also expires loaded objects
+        # so the next request reads fresh rows.
+        _request_session.rollback()
 
 
 app.dependency_overrides[get_db] = override_get_db
 
 
 # ---------------------------------------------------------------------------
-# Session-Scoped Database Lifecycle
+# Session-Wide Database Lifecycle
 # ---------------------------------------------------------------------------
 
-@pytest.fixture(scope="session", autouse=True)
-def setup_database():
-    """Create tables once for the entire test session."""
+def pytest_sessionstart(session):
+    """Create and seed the tables once, before any test is collected."""
     Base.metadata.create_all(bind=engine)
     _seed_disease_data()
     _seed_mandi_data()
 
-    # Warm up middleware stack and raise the rate limit so the
-    # 126+ tests in a single session are never throttled.
-    from app.middleware.rate_limiter import RateLimitMiddleware
-
-    with TestClient(app) as warmup_client:
-        warmup_client.get("/")
 
-    stack = app.middleware_stack
-    while stack is not None:
-        if isinstance(stack, RateLimitMiddleware):
-            stack.max_requests = 999_999
-            stack._requests.clear()
-            break
-        stack = getattr(stack, "app", None)
-
-    yield
+def pytest_sessionfinish(session, exitstatus):
+    """Drop the tables once the whole session has finished."""
+    _request_session.close()
     Base.metadata.drop_all(bind=engine)
-    db_file = Path("test_farmhelp.db")
-    if db_file.exists():
-        db_file.unlink()
 
 
 # ---------------------------------------------------------------------------
 # Client Fixture
 # ---------------------------------------------------------------------------
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def client():
-    """Return a TestClient for the FastAPI app."""
-    return TestClient(app)
+    """
+    Return a TestClient for the FastAPI app, shared by the whole session.
+
+    Entering the client runs the app lifespan once for the session; the API
+    sets no cookies, so one client carries no state between tests.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def cached_get(client):
+    """
+    GET a URL through the shared client once per session.
+
+    Returns ``(status_code, json_body)``. The raw response is memoised by
+    URL and decoded on every call, so each test gets its own body to
+    mutate freely.
+    """
+    @lru_cache(maxsize=256)
+    def fetch(url):
+        resp = client.get(url)
+        return resp.status_code, resp.content
+
+    def get(url):
+        status_code, content = fetch(url)
+        return status_code, _json_loads(content)
+
+    return get
+
+
+@pytest.fixture(scope="session")
+def json_body():
+    """
+    Decode a response body with ``orjson``.
+
+    A faster stand-in for ``resp.json()`` on the larger payloads.
+    """
+    def decode(resp):
+        return _json_loads(resp.content)
+
+    return decode
 
 
 @pytest.fixture()
@@ -109,9 +164,11 @@ def db_session():
 # Mock Weather Forecast Data
 # ---------------------------------------------------------------------------
 
-MOCK_FORECAST_DATA = {
-    "daily": {
-        "time": [
+# Read-only views (tuples for series) so a test or the service under test
+# cannot mutate the shared data that every weather fixture returns.
+MOCK_FORECAST_DATA = MappingProxyType({
+    "daily": MappingProxyType({
+        "time": (
             "2026-02-07",
             "2026-02-08",
             "2026-02-09",
@@ -119,256 +176,267 @@ MOCK_FORECAST_DATA = {
             "2026-02-11",
             "2026-02-12",
             "2026-02-13",
-        ],
-        "temperature_2m_max": [28.5, 29.0, 30.2, 31.0, 29.5, 28.0, 27.5],
-        "temperature_2m_min": [18.0, 17.5, 19.0, 20.0, 18.5, 17.0, 16.5],
-        "precipitation_sum": [0.0, 2.5, 0.0, 0.0, 5.0, 0.0, 0.0],
-        "windspeed_10m_max": [12.0, 15.0, 10.0, 8.0, 20.0, 14.0, 11.0],
-        "relative_humidity_2m_max": [65, 70, 60, 55, 75, 68, 62],
-        "weathercode": [1, 3, 0, 0, 61, 2, 1],
-    },
-    "daily_units": {
+        ),
+        "temperature_2m_max": (28.5, 29.0, 30.2, 31.0, 29.5, 28.0, 27.5),
+        "temperature_2m_min": (18.0, 17.5, 19.0, 20.0, 18.5, 17.0, 16.5),
+        "precipitation_sum": (0.0, 2.5, 0.0, 0.0, 5.0, 0.0, 0.0),
+        "windspeed_10m_max": (12.0, 15.0, 10.0, 8.0, 20.0, 14.0, 11.0),
+        "relative_humidity_2m_max": (65, 70, 60, 55, 75, 68, 62),
+        "weathercode": (1, 3, 0, 0, 61, 2, 1),
+    }),
+    "daily_units": MappingProxyType({
         "temperature_2m_max": "C",
         "temperature_2m_min": "C",
         "precipitation_sum": "mm",
         "windspeed_10m_max": "km/h",
-    },
-}
-
-
-MOCK_PINCODE_DATA = {
-    "110001": {
-        "lat": 28.6139,
-        "lon": 77.2090,
-        "city": "New Delhi",
-        "state": "Delhi",
-    },
-    "400001": {
-        "lat": 18.9388,
-        "lon": 72.8354,
-        "city": "Mumbai",
-        "state": "Maharashtra",
-    },
-}
+    }),
+})
+
+
+MOCK_LOCATION_DATA = MappingProxyType({
+    "lat": 21.7553,
+    "lon": 70.6203,
+    "state": "Gujarat",
+    "district": "Rajkot",
+    "taluka": "Jetpur",
+    "soil_type": "medium_black",
+    "elevation_m": 110,
+})
+
+
+_WEATHER_SERVICE = "app.services.weather_service"
+
+
+def _apply_weather_patches(monkeypatch, cached=False):
+    """
+    Replace weather-service functions with plain stubs.
+
+    Taluka resolution always returns MOCK_LOCATION_DATA. With ``cached``
+    the cache read returns MOCK_FORECAST_DATA from an hour ago; otherwise
+    the cache misses, the Open-Meteo call returns MOCK_FORECAST_DATA and
+    the cache write is a no-op.
+    """
+    monkeypatch.setattr(
+        f"{_WEATHER_SERVICE}.resolve_taluka", lambda *args, **kwargs: dict(MOCK_LOCATION_DATA)
+    )
+    if cached:
+        cached_entry = (MOCK_FORECAST_DATA, datetime.now(timezone.utc) - timedelta(hours=1))
+        monkeypatch.setattr(
+            f"{_WEATHER_SERVICE}.get_cached_forecast", lambda *args, **kwargs: cached_entry
+        )
+        return
+
+    async def fetch_forecast(*args, **kwargs):
+        return MOCK_FORECAST_DATA
+
+    monkeypatch.setattr(f"{_WEATHER_SERVICE}.fetch_forecast_from_api", fetch_forecast)
+    monkeypatch.setattr(f"{_WEATHER_SERVICE}.get_cached_forecast", lambda *args, **kwargs: None)
+    monkeypatch.setattr(f"{_WEATHER_SERVICE}.store_forecast_cache", lambda *args, **kwargs: None)
 
 
 @pytest.fixture()
-def mock_weather_api():
+def mock_weather_api(monkeypatch):
     """
     Patch the weather service to avoid real HTTP calls.
 
     Mocks:
-    - Pincode resolution (returns MOCK_PINCODE_DATA)
+    - Taluka resolution (returns MOCK_LOCATION_DATA)
     - Open-Meteo API call (returns MOCK_FORECAST_DATA)
     - Weather cache read (returns None so API path is exercised)
     - Weather cache write (no-op)
     """
-    with (
-        patch(
-            "app.services.weather_service._load_pincode_data",
-            return_value=MOCK_PINCODE_DATA,
-        ),
-        patch(
-            "app.services.weather_service.fetch_forecast_from_api",
-            new_callable=AsyncMock,
-            return_value=MOCK_FORECAST_DATA,
-        ),
-        patch(
-            "app.services.weather_service.get_cached_forecast",
-            return_value=None,
-        ),
-        patch(
-            "app.services.weather_service.store_forecast_cache",
-        ),
-    ):
-        yield
+    _apply_weather_patches(monkeypatch)
 
 
 @pytest.fixture()
-def mock_weather_cached():
+def mock_weather_cached(monkeypatch):
     """
     Patch weather service to return cached data (cache-hit path).
     """
-    cached_at = datetime.now(timezone.utc) - timedelta(hours=1)
-    with (
-        patch(
-            "app.services.weather_service._load_pincode_data",
-            return_value=MOCK_PINCODE_DATA,
-        ),
-        patch(
-            "app.services.weather_service.get_cached_forecast",
-            return_value=(MOCK_FORECAST_DATA, cached_at),
-        ),
-    ):
-        yield
+    _apply_weather_patches(monkeypatch, cached=True)
 
 
 # ---------------------------------------------------------------------------
 # Seed Helpers
 # ---------------------------------------------------------------------------
 
+_DISEASE_ROWS = (
+    dict(
+        disease_name="Paddy Blast",
+        disease_name_hindi="धान का ब्लास्ट",
+        crop_type="Paddy",
+        symptoms="Spindle-shaped lesions on leaves with brown centers and gray margins.",
+        treatment_chemical="Tricyclazole 75% WP @ 0.6g/l",
+        treatment_organic="Neem oil spray, proper drainage",
+        dosage="0.6g per liter of water",
+        cost_per_acre=500.0,
+        prevention_tips="Use resistant varieties, avoid excess nitrogen",
+        affected_stages="Tillering, Flowering",
+    ),
+    dict(
+        disease_name="Brown Spot of Paddy",
+        disease_name_hindi="धान का भूरा धब्बा",
+        crop_type="Paddy",
+        symptoms="Small, circular to oval brown spots on leaves with yellow halos.",
+        treatment_chemical="Mancozeb 75% WP @ 2g/l",
+        treatment_organic="Neem seed kernel extract (5%)",
+        dosage="2g per liter of water",
+        cost_per_acre=450.0,
+        prevention_tips="Use certified seeds",
+        affected_stages="Seedling, Tillering, Flowering",
+    ),
+    dict(
+        disease_name="Rust of Wheat",
+        disease_name_hindi="गेहूं का रस्ट",
+        crop_type="Wheat",
+        symptoms="Orange to brown pustules on leaves, stems, and heads.",
+        treatment_chemical="Propiconazole 25% EC @ 0.5ml/l",
+        treatment_organic="Use resistant varieties, proper crop rotation",
+        dosage="0.5ml per liter of water",
+        cost_per_acre=600.0,
+        prevention_tips="Use resistant varieties",
+        affected_stages="Tillering, Booting, Heading",
+    ),
+    dict(
+        disease_name="Early Blight of Tomato",
+        disease_name_hindi="टमाटर का अर्ली ब्लाइट",
+        crop_type="Tomato",
+        symptoms="Dark brown to black spots on leaves with concentric rings.",
+        treatment_chemical="Mancozeb 75% WP @ 2g/l",
+        treatment_organic="Neem oil spray, copper-based fungicides",
+        dosage="2g per liter of water",
+        cost_per_acre=650.0,
+        prevention_tips="Use resistant varieties, maintain proper spacing",
+        affected_stages="Vegetative, Flowering, Fruiting",
+    ),
+)
+
+# (days before today, row); arrival dates are resolved at seed time
+_MANDI_ROWS = (
+    (
+        1,
+        dict(
+            commodity="Wheat",
+            mandi_name="Azadpur Mandi",
+            state="Delhi",
+            district="North Delhi",
+            price_per_quintal=2200.0,
+            min_price=2100.0,
+            max_price=2300.0,
+            modal_price=2200.0,
+        ),
+    ),
+    (
+        1,
+        dict(
+            commodity="Wheat",
+            mandi_name="Khanna Mandi",
+            state="Punjab",
+            district="Ludhiana",
+            price_per_quintal=2350.0,
+            min_price=2200.0,
+            max_price=2500.0,
+            modal_price=2350.0,
+        ),
+    ),
+    (
+        2,
+        dict(
+            commodity="Wheat",
+            mandi_name="Karnal Mandi",
+            state="Haryana",
+            district="Karnal",
+            price_per_quintal=2280.0,
+            min_price=2150.0,
+            max_price=2400.0,
+            modal_price=2280.0,
+        ),
+    ),
+    (
+        1,
+        dict(
+            commodity="Rice",
+            mandi_name="Azadpur Mandi",
+            state="Delhi",
+            district="North Delhi",
+            price_per_quintal=3200.0,
+            min_price=3000.0,
+            max_price=3400.0,
+            modal_price=3200.0,
+        ),
+    ),
+    (
+        1,
+        dict(
+            commodity="Rice",
+            mandi_name="Khanna Mandi",
+            state="Punjab",
+            district="Ludhiana",
+            price_per_quintal=3100.0,
+            min_price=2900.0,
+            max_price=3300.0,
+            modal_price=3100.0,
+        ),
+    ),
+    (
+        5,
+        dict(
+            commodity="Wheat",
+            mandi_name="Azadpur Mandi",
+            state="Delhi",
+            district="North Delhi",
+            price_per_quintal=2150.0,
+            min_price=2050.0,
+            max_price=2250.0,
+            modal_price=2150.0,
+        ),
+    ),
+    (
+        10,
+        dict(
+            commodity="Wheat",
+            mandi_name="Azadpur Mandi",
+            state="Delhi",
+            district="North Delhi",
+            price_per_quintal=2100.0,
+            min_price=2000.0,
+            max_price=2200.0,
+            modal_price=2100.0,
+        ),
+    ),
+    (
+        1,
+        dict(
+            commodity="Onion",
+            mandi_name="Lasalgaon Mandi",
+            state="Maharashtra",
+            district="Nashik",
+            price_per_quintal=1800.0,
+            min_price=1600.0,
+            max_price=2000.0,
+            modal_price=1800.0,
+        ),
+    ),
+)
+
+
 def _seed_disease_data():
     """Insert a minimal set of diseases for testing."""
-    db = TestingSessionLocal()
-    try:
-        if db.query(DiseaseTreatment).count() > 0:
-            return
-
-        diseases = [
-            DiseaseTreatment(
-                disease_name="Paddy Blast",
-                disease_name_hindi="धान का ब्लास्ट",
-                crop_type="Paddy",
-                symptoms="Spindle-shaped lesions on leaves with brown centers and gray margins.",
-                treatment_chemical="Tricyclazole 75% WP @ 0.6g/l",
-                treatment_organic="Neem oil spray, proper drainage",
-                dosage="0.6g per liter of water",
-                cost_per_acre=500.0,
-                prevention_tips="Use resistant varieties, avoid excess nitrogen",
-                affected_stages="Tillering, Flowering",
-            ),
-            DiseaseTreatment(
-                disease_name="Brown Spot of Paddy",
-                disease_name_hindi="धान का भूरा धब्बा",
-                crop_type="Paddy",
-                symptoms="Small, circular to oval brown spots on leaves with yellow halos.",
-                treatment_chemical="Mancozeb 75% WP @ 2g/l",
-                treatment_organic="Neem seed kernel extract (5%)",
-                dosage="2g per liter of water",
-                cost_per_acre=450.0,
-                prevention_tips="Use certified seeds",
-                affected_stages="Seedling, Tillering, Flowering",
-            ),
-            DiseaseTreatment(
-                disease_name="Rust of Wheat",
-                disease_name_hindi="गेहूं का रस्ट",
-                crop_type="Wheat",
-                symptoms="Orange to brown pustules on leaves, stems, and heads.",
-                treatment_chemical="Propiconazole 25% EC @ 0.5ml/l",
-                treatment_organic="Use resistant varieties, proper crop rotation",
-                dosage="0.5ml per liter of water",
-                cost_per_acre=600.0,
-                prevention_tips="Use resistant varieties",
-                affected_stages="Tillering, Booting, Heading",
-            ),
-            DiseaseTreatment(
-                disease_name="Early Blight of Tomato",
-                disease_name_hindi="टमाटर का अर्ली ब्लाइट",
-                crop_type="Tomato",
-                symptoms="Dark brown to black spots on leaves with concentric rings.",
-                treatment_chemical="Mancozeb 75% WP @ 2g/l",
-                treatment_organic="Neem oil spray, copper-based fungicides",
-                dosage="2g per liter of water",
-                cost_per_acre=650.0,
-                prevention_tips="Use resistant varieties, maintain proper spacing",
-                affected_stages="Vegetative, Flowering, Fruiting",
-            ),
-        ]
-        db.add_all(diseases)
-        db.commit()
-    finally:
-        db.close()
+    with engine.begin() as conn:
+        conn.execute(DiseaseTreatment.__table__.insert(), _DISEASE_ROWS)
 
 
 def _seed_mandi_data():
     """Insert mandi price records for testing."""
-    db = TestingSessionLocal()
-    try:
-        if db.query(MandiPrice).count() > 0:
-            return
-
-        now = datetime.now(timezone.utc)
-        prices = [
-            MandiPrice(
-                commodity="Wheat",
-                mandi_name="Azadpur Mandi",
-                state="Delhi",
-                district="North Delhi",
-                price_per_quintal=2200.0,
-                min_price=2100.0,
-                max_price=2300.0,
-                modal_price=2200.0,
-                arrival_date=now - timedelta(days=1),
-            ),
-            MandiPrice(
-                commodity="Wheat",
-                mandi_name="Khanna Mandi",
-                state="Punjab",
-                district="Ludhiana",
-                price_per_quintal=2350.0,
-                min_price=2200.0,
-                max_price=2500.0,
-                modal_price=2350.0,
-                arrival_date=now - timedelta(days=1),
-            ),
-            MandiPrice(
-                commodity="Wheat",
-                mandi_name="Karnal Mandi",
-                state="Haryana",
-                district="Karnal",
-                price_per_quintal=2280.0,
-                min_price=2150.0,
-                max_price=2400.0,
-                modal_price=2280.0,
-                arrival_date=now - timedelta(days=2),
-            ),
-            MandiPrice(
-                commodity="Rice",
-                mandi_name="Azadpur Mandi",
-                state="Delhi",
-                district="North Delhi",
-                price_per_quintal=3200.0,
-                min_price=3000.0,
-                max_price=3400.0,
-                modal_price=3200.0,
-                arrival_date=now - timedelta(days=1),
-            ),
-            MandiPrice(
-                commodity="Rice",
-                mandi_name="Khanna Mandi",
-                state="Punjab",
-                district="Ludhiana",
-                price_per_quintal=3100.0,
-                min_price=2900.0,
-                max_price=3300.0,
-                modal_price=3100.0,
-                arrival_date=now - timedelta(days=1),
-            ),
-            MandiPrice(
-                commodity="Wheat",
-                mandi_name="Azadpur Mandi",
-                state="Delhi",
-                district="North Delhi",
-                price_per_quintal=2150.0,
-                min_price=2050.0,
-                max_price=2250.0,
-                modal_price=2150.0,
-                arrival_date=now - timedelta(days=5),
-            ),
-            MandiPrice(
-                commodity="Wheat",
-                mandi_name="Azadpur Mandi",
-                state="Delhi",
-                district="North Delhi",
-                price_per_quintal=2100.0,
-                min_price=2000.0,
-                max_price=2200.0,
-                modal_price=2100.0,
-                arrival_date=now - timedelta(days=10),
-            ),
-            MandiPrice(
-                commodity="Onion",
-                mandi_name="Lasalgaon Mandi",
-                state="Maharashtra",
-                district="Nashik",
-                price_per_quintal=1800.0,
-                min_price=1600.0,
-                max_price=2000.0,
-                modal_price=1800.0,
-                arrival_date=now - timedelta(days=1),
-            ),
-        ]
-        db.add_all(prices)
-        db.commit()
-    finally:
-        db.close()
+    # One timestamp per distinct age rather than one per row
+    now = datetime.now(timezone.utc)
+    arrival_dates = {
+        days_ago: now - timedelta(days=days_ago)
+        for days_ago in {days_ago for days_ago, _ in _MANDI_ROWS}
+    }
+    prices = [
+        {**row, "arrival_date": arrival_dates[days_ago]}
+        for days_ago, row in _MANDI_ROWS
+    ]
+    with engine.begin() as conn:
+        conn.execute(MandiPrice.__table__.insert(), prices)
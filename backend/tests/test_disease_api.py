@@ -8,10 +8,9 @@ import pytest
 class TestListDiseases:
     """Tests for GET /api/disease/list"""
 
-    def test_list_all(self, client):
-        resp = client.get("/api/disease/list")
-        assert resp.status_code == 200
-        body = resp.json()
+    def test_list_all(self, cached_get):
+        status_code, body = cached_get("/api/disease/list")
+        assert status_code == 200
         assert "total" in body
         assert "diseases" in body
         assert body["total"] >= 4
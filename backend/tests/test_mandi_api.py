@@ -23,19 +23,17 @@ class TestMandiHealth:
 class TestMandiCommodities:
     """Tests for GET /api/mandi/commodities"""
 
-    def test_list_commodities(self, client):
-        resp = client.get("/api/mandi/commodities")
-        assert resp.status_code == 200
-        body = resp.json()
+    def test_list_commodities(self, cached_get):
+        status_code, body = cached_get("/api/mandi/commodities")
+        assert status_code == 200
         assert body["total"] >= 3
         names = [c["commodity"] for c in body["commodities"]]
         assert "Wheat" in names
         assert "Rice" in names
         assert "Onion" in names
 
-    def test_commodity_fields(self, client):
-        resp = client.get("/api/mandi/commodities")
-        body = resp.json()
+    def test_commodity_fields(self, cached_get):
+        _, body = cached_get("/api/mandi/commodities")
         for c in body["commodities"]:
             assert "commodity" in c
             assert "record_count" in c
@@ -48,10 +46,10 @@ class TestMandiCommodities:
 class TestMandiPrices:
     """Tests for GET /api/mandi/prices"""
 
-    def test_all_prices(self, client):
+    def test_all_prices(self, client, json_body):
         resp = client.get("/api/mandi/prices")
         assert resp.status_code == 200
-        body = resp.json()
+        body = json_body(resp)
         assert body["total"] >= 8
         assert "prices" in body
 
@@ -117,18 +115,16 @@ class TestMandiPrices:
 class TestMandiCompare:
     """Tests for GET /api/mandi/compare"""
 
-    def test_compare_wheat(self, client):
-        resp = client.get("/api/mandi/compare?commodity=Wheat")
-        assert resp.status_code == 200
-        body = resp.json()
+    def test_compare_wheat(self, cached_get):
+        status_code, body = cached_get("/api/mandi/compare?commodity=Wheat")
+        assert status_code == 200
         assert body["commodity"] == "Wheat"
         assert body["total_mandis"] >= 2
         assert "mandis" in body
         assert "analytics" in body
 
-    def test_compare_analytics_fields(self, client):
-        resp = client.get("/api/mandi/compare?commodity=Wheat")
-        body = resp.json()
+    def test_compare_analytics_fields(self, cached_get):
+        _, body = cached_get("/api/mandi/compare?commodity=Wheat")
         analytics = body["analytics"]
         assert "average_price" in analytics
         assert "price_range" in analytics
@@ -162,10 +158,9 @@ class TestMandiCompare:
 class TestMandiBest:
     """Tests for GET /api/mandi/best"""
 
-    def test_best_mandi_no_location(self, client):
-        resp = client.get("/api/mandi/best?commodity=Wheat")
-        assert resp.status_code == 200
-        body = resp.json()
+    def test_best_mandi_no_location(self, cached_get):
+        status_code, body = cached_get("/api/mandi/best?commodity=Wheat")
+        assert status_code == 200
         assert body["commodity"] == "Wheat"
         assert body["total_mandis"] >= 2
         assert "recommendations" in body
@@ -184,9 +179,8 @@ class TestMandiBest:
             assert "net_price_per_quintal" in rec
             assert rec["rank"] >= 1
 
-    def test_best_mandi_ranking_order(self, client):
-        resp = client.get("/api/mandi/best?commodity=Wheat")
-        body = resp.json()
+    def test_best_mandi_ranking_order(self, cached_get):
+        _, body = cached_get("/api/mandi/best?commodity=Wheat")
         recs = body["recommendations"]
         if len(recs) >= 2:
             for i in range(len(recs) - 1):
@@ -205,19 +199,17 @@ class TestMandiBest:
 class TestMandiTrends:
     """Tests for GET /api/mandi/trends"""
 
-    def test_trends_wheat(self, client):
-        resp = client.get("/api/mandi/trends?commodity=Wheat&days=30")
-        assert resp.status_code == 200
-        body = resp.json()
+    def test_trends_wheat(self, cached_get):
+        status_code, body = cached_get("/api/mandi/trends?commodity=Wheat&days=30")
+        assert status_code == 200
         assert body["commodity"] == "Wheat"
         assert body["data_points"] >= 3
         assert "trend" in body
         assert "price_history" in body
         assert "statistics" in body
 
-    def test_trends_statistics_fields(self, client):
-        resp = client.get("/api/mandi/trends?commodity=Wheat&days=30")
-        body = resp.json()
+    def test_trends_statistics_fields(self, cached_get):
+        _, body = cached_get("/api/mandi/trends?commodity=Wheat&days=30")
         stats = body["statistics"]
         assert "count" in stats
         assert "mean" in stats
@@ -232,9 +224,8 @@ class TestMandiTrends:
         body = resp.json()
         assert body["state"] == "Delhi"
 
-    def test_trends_price_history_sorted(self, client):
-        resp = client.get("/api/mandi/trends?commodity=Wheat&days=30")
-        body = resp.json()
+    def test_trends_price_history_sorted(self, cached_get):
+        _, body = cached_get("/api/mandi/trends?commodity=Wheat&days=30")
         dates = [h["date"] for h in body["price_history"]]
         assert dates == sorted(dates)
 
@@ -245,9 +236,8 @@ class TestMandiTrends:
         assert body["data_points"] == 0
         assert "No price data" in body.get("message", "")
 
-    def test_trends_highest_lowest(self, client):
-        resp = client.get("/api/mandi/trends?commodity=Wheat&days=30")
-        body = resp.json()
+    def test_trends_highest_lowest(self, cached_get):
+        _, body = cached_get("/api/mandi/trends?commodity=Wheat&days=30")
         if body["data_points"] > 0:
             assert "highest_price_mandi" in body
             assert "lowest_price_mandi" in body
@@ -48,6 +48,12 @@ class TestHealthCheck:
         assert "api" in body["components"]
         assert body["components"]["api"]["status"] == "operational"
 
+    def test_health_echoes_request_id(self, client):
+        resp = client.get("/health", headers={"X-Request-ID": 'id-with-"quotes"'})
+        body = resp.json()
+        assert body["request_id"] == 'id-with-"quotes"'
+        assert body["timestamp"] != "__HEALTH_TIMESTAMP__"
+
 
 class TestRequestIDMiddleware:
     """Verify the X-Request-ID header is present on all responses."""
@@ -108,15 +114,15 @@ class TestErrorHandling:
 class TestAPIVersioning:
     """Verify both legacy and v1 prefixed routes are reachable."""
 
-    def test_legacy_disease_list(self, client):
-        resp = client.get("/api/disease/list")
-        assert resp.status_code == 200
+    def test_legacy_disease_list(self, cached_get):
+        status_code, _ = cached_get("/api/disease/list")
+        assert status_code == 200
 
-    def test_v1_disease_list(self, client):
-        resp = client.get("/api/v1/disease/list")
-        assert resp.status_code == 200
+    def test_v1_disease_list(self, cached_get):
+        status_code, _ = cached_get("/api/v1/disease/list")
+        assert status_code == 200
 
-    def test_v1_and_legacy_same_data(self, client):
-        r_legacy = client.get("/api/disease/list")
-        r_v1 = client.get("/api/v1/disease/list")
-        assert r_legacy.json()["total"] == r_v1.json()["total"]
+    def test_v1_and_legacy_same_data(self, cached_get):
+        _, legacy_body = cached_get("/api/disease/list")
+        _, v1_body = cached_get("/api/v1/disease/list")
+        assert legacy_body["total"] == v1_body["total"]
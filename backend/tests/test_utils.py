@@ -2,6 +2,7 @@
 Unit tests for utility functions, custom exceptions, and constants.
 """
 
+import json
 import math
 from datetime import datetime, timezone
 
@@ -14,12 +15,17 @@ from app.utils.helpers import (
     generate_request_id,
     utc_now,
     format_iso,
+    parse_iso_datetime,
     sanitize_string,
     sanitize_query,
     haversine_distance,
+    haversine_distances_prepared,
+    prepare_point,
     clamp,
     safe_float,
     chunk_list,
+    iter_chunks,
+    load_json_file,
 )
 from app.utils.exceptions import (
     AppException,
@@ -29,6 +35,8 @@ from app.utils.exceptions import (
     RateLimitError,
     DatabaseError,
 )
+from app.utils import validators
+from app.utils.validators import validate_disease_data
 from app.utils.constants import (
     API_V1_PREFIX,
     API_LEGACY_PREFIX,
@@ -36,6 +44,8 @@ from app.utils.constants import (
     MAX_PAGE_SIZE,
     HEALTH_STATUS_HEALTHY,
     HEALTH_STATUS_DEGRADED,
+    SUPPORTED_CROPS,
+    SUPPORTED_CROPS_DISPLAY,
 )
 
 
@@ -150,6 +160,14 @@ class TestDateTimeHelpers:
     def test_format_iso_none(self):
         assert format_iso(None) is None
 
+    def test_parse_iso_datetime_zulu(self):
+        dt = parse_iso_datetime("2026-01-15T12:00:00Z")
+        assert dt == datetime(2026, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+    def test_parse_iso_datetime_invalid(self):
+        with pytest.raises(ValueError):
+            parse_iso_datetime("not-a-date")
+
 
 # ---------------------------------------------------------------------------
 # String Sanitisation Tests
@@ -174,9 +192,15 @@ class TestSanitizeQuery:
         assert "%" not in result
         assert "_" not in result
 
+    def test_removes_like_escape_char(self):
+        assert sanitize_query("Paddy\\Blast") == "PaddyBlast"
+
     def test_preserves_valid_chars(self):
         assert sanitize_query("Paddy Blast") == "Paddy Blast"
 
+    def test_collapses_gap_left_by_removed_chars(self):
+        assert sanitize_query("  Paddy % Blast ") == "Paddy Blast"
+
 
 # ---------------------------------------------------------------------------
 # Haversine Distance Tests
@@ -198,6 +222,17 @@ class TestHaversineDistance:
         d2 = haversine_distance(18.9, 72.8, 28.6, 77.2)
         assert d1 == pytest.approx(d2, abs=0.01)
 
+    def test_batch_matches_scalar(self):
+        points = [(28.6, 77.2), (18.9388, 72.8354), (30.7, 76.8)]
+        batch = haversine_distances_prepared(
+            28.6139, 77.2090, [prepare_point(*p) for p in points]
+        )
+        expected = [haversine_distance(28.6139, 77.2090, *p) for p in points]
+        assert batch == pytest.approx(expected, abs=1e-6)
+
+    def test_batch_empty(self):
+        assert haversine_distances_prepared(28.6, 77.2, []) == []
+
 
 # ---------------------------------------------------------------------------
 # Miscellaneous Helpers
@@ -244,6 +279,87 @@ class TestChunkList:
         assert chunk_list([], 3) == []
 
 
+class TestIterChunks:
+
+    def test_matches_chunk_list(self):
+        items = [1, 2, 3, 4, 5]
+        assert list(iter_chunks(items, 2)) == chunk_list(items, 2)
+
+    def test_accepts_generator(self):
+        result = list(iter_chunks((i for i in range(5)), 3))
+        assert result == [[0, 1, 2], [3, 4]]
+
+    def test_empty(self):
+        assert list(iter_chunks([], 3)) == []
+
+
+class TestLoadJsonFile:
+
+    def test_parses_utf8(self, tmp_path):
+        path = tmp_path / "data.json"
+        path.write_text('{"name": "धान", "values": [1, 2.5]}', encoding="utf-8")
+        assert load_json_file(path) == {"name": "धान", "values": [1, 2.5]}
+
+    def test_invalid_json_raises_decode_error(self, tmp_path):
+        path = tmp_path / "broken.json"
+        path.write_text("{not json", encoding="utf-8")
+        with pytest.raises(json.JSONDecodeError):
+            load_json_file(path)
+
+
+# ---------------------------------------------------------------------------
+# Validator Tests
+# ---------------------------------------------------------------------------
+
+class TestValidateDiseaseData:
+
+    VALID = {
+        "disease_name": "Leaf Blast",
+        "crop_type": "Rice",
+        "symptoms": "Spindle-shaped lesions on leaves",
+    }
+
+    def test_valid(self):
+        assert validate_disease_data(dict(self.VALID)) == (True, None)
+
+    def test_short_symptoms_reported_before_long_dosage(self):
+        record = dict(self.VALID, symptoms="spots", dosage="x" * 501)
+        assert validate_disease_data(record) == (
+            False, "symptoms must be at least 10 characters"
+        )
+
+    def test_negative_cost_reported_before_long_image_url(self):
+        record = dict(self.VALID, cost_per_acre=-1, image_url="x" * 501)
+        assert validate_disease_data(record) == (False, "cost_per_acre must be >= 0")
+
+
+class TestValidateRecords:
+
+    RECORDS = [
+        dict(TestValidateDiseaseData.VALID),
+        dict(TestValidateDiseaseData.VALID, symptoms="spots"),
+        dict(TestValidateDiseaseData.VALID),
+        dict(TestValidateDiseaseData.VALID, cost_per_acre=-1),
+        dict(TestValidateDiseaseData.VALID),
+    ]
+
+    def test_process_pool_matches_serial(self, monkeypatch):
+        serial = validators._validate_records(self.RECORDS, validate_disease_data)
+
+        monkeypatch.setattr(validators, "_PARALLEL_VALIDATION_MIN_RECORDS", 1)
+        monkeypatch.setattr(validators, "_PARALLEL_VALIDATION_BATCH_SIZE", 2)
+        parallel = validators._validate_records(self.RECORDS, validate_disease_data)
+
+        assert parallel == serial == (
+            False,
+            [
+                "Record 2: symptoms must be at least 10 characters",
+                "Record 4: cost_per_acre must be >= 0",
+            ],
+            3,
+        )
+
+
 # ---------------------------------------------------------------------------
 # Custom Exception Tests
 # ---------------------------------------------------------------------------
@@ -344,3 +460,8 @@ class TestConstants:
     def test_health_statuses(self):
         assert HEALTH_STATUS_HEALTHY == "healthy"
         assert HEALTH_STATUS_DEGRADED == "degraded"
+
+    def test_supported_crops(self):
+        assert "Paddy" in SUPPORTED_CROPS
+        assert SUPPORTED_CROPS == frozenset(SUPPORTED_CROPS_DISPLAY)
+        assert SUPPORTED_CROPS_DISPLAY[0] == "Paddy"
@@ -11,10 +11,10 @@ import pytest
 class TestWeatherForecast:
     """Tests for GET /api/weather/forecast"""
 
-    def test_forecast_success(self, client, mock_weather_api):
+    def test_forecast_success(self, client, mock_weather_api, json_body):
         resp = client.get("/api/weather/forecast?pincode=110001")
         assert resp.status_code == 200
-        body = resp.json()
+        body = json_body(resp)
         assert body["pincode"] == "110001"
         assert "forecast" in body
         assert "location" in body
@@ -28,16 +28,13 @@ class TestWeatherForecast:
         assert body["cached"] is True
         assert body["cached_at"] is not None
 
-    def test_forecast_invalid_pincode_short(self, client):
-        resp = client.get("/api/weather/forecast?pincode=1100")
-        assert resp.status_code == 422
-
-    def test_forecast_invalid_pincode_letters(self, client):
-        resp = client.get("/api/weather/forecast?pincode=abcdef")
-        assert resp.status_code == 422
-
-    def test_forecast_missing_pincode(self, client):
-        resp = client.get("/api/weather/forecast")
+    @pytest.mark.parametrize(
+        "query",
+        ["?pincode=1100", "?pincode=abcdef", ""],
+        ids=["short", "letters", "missing"],
+    )
+    def test_forecast_invalid_pincode(self, client, query):
+        resp = client.get(f"/api/weather/forecast{query}")
         assert resp.status_code == 422
 
     def test_forecast_unknown_pincode(self, client, mock_weather_api):
@@ -136,10 +133,9 @@ class TestWeatherAnalyze:
 class TestWeatherCrops:
     """Tests for GET /api/weather/crops"""
 
-    def test_list_crops(self, client):
-        resp = client.get("/api/weather/crops")
-        assert resp.status_code == 200
-        body = resp.json()
+    def test_list_crops(self, cached_get):
+        status_code, body = cached_get("/api/weather/crops")
+        assert status_code == 200
         assert "total" in body
         assert "crops" in body
         assert body["total"] >= 10
@@ -147,9 +143,8 @@ class TestWeatherCrops:
         assert "Paddy" in crop_names
         assert "Wheat" in crop_names
 
-    def test_crop_fields(self, client):
-        resp = client.get("/api/weather/crops")
-        body = resp.json()
+    def test_crop_fields(self, cached_get):
+        _, body = cached_get("/api/weather/crops")
         for crop in body["crops"]:
             assert "crop_type" in crop
             assert "optimal_temp_range" in crop
@@ -165,7 +160,7 @@ class TestWeatherV1Routes:
         assert resp.status_code == 200
         assert resp.json()["pincode"] == "110001"
 
-    def test_v1_crops(self, client):
-        resp = client.get("/api/v1/weather/crops")
-        assert resp.status_code == 200
-        assert resp.json()["total"] >= 10
+    def test_v1_crops(self, cached_get):
+        status_code, body = cached_get("/api/v1/weather/crops")
+        assert status_code == 200
+        assert body["total"] >= 10
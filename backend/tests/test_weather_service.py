@@ -0,0 +1,217 @@
+"""
+Unit tests for weather service internals that the API tests cannot reach.
+"""
+
+import asyncio
+
+import pytest
+
+from app.services import weather_service
+
+
+# Open-Meteo style series whose precision any 0.1 / whole-percent rounding
+# would change: rounded, the means would be 29.23 C and 68.0 %.
+_UNROUNDED_DAILY = {
+    "time": ["2026-02-07", "2026-02-08", "2026-02-09"],
+    "temperature_2m_max": [28.46, 29.04, 30.25],
+    "relative_humidity_2m_max": [64.7, 71.2],
+}
+
+
+def _unrounded_forecast():
+    return {"daily": {key: list(values) for key, values in _UNROUNDED_DAILY.items()}}
+
+
+class _RecordingSession:
+    """Stands in for a Session, keeping the rows store_forecast_cache writes."""
+
+    def __init__(self):
+        self.rows = []
+
+    def execute(self, statement, row):
+        self.rows.append(row)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+class TestForecastPrecision:
+    """Only the stored cache payload is rounded; live responses are not."""
+
+    def test_fetched_values_are_returned_unrounded(self, monkeypatch):
+        async def request_open_meteo(params):
+            return _unrounded_forecast()
+
+        monkeypatch.setattr(weather_service, "_request_open_meteo", request_open_meteo)
+        result = asyncio.run(weather_service.fetch_forecast_from_api(21.75, 70.62))
+
+        daily = result["daily"]
+        assert daily["temperature_2m_max"] == [28.46, 29.04, 30.25]
+        assert daily["relative_humidity_2m_max"] == [64.7, 71.2]
+
+        stats = weather_service._scan_daily(daily)
+        assert stats.tmax_sum / stats.tmax_count == pytest.approx(29.25)
+        assert stats.humidity_sum / stats.humidity_count == pytest.approx(67.95)
+
+    def test_cache_payload_is_rounded(self):
+        db = _RecordingSession()
+        forecast = _unrounded_forecast()
+        weather_service.store_forecast_cache(db, "Jetpur", 21.75, 70.62, forecast)
+
+        (row,) = db.rows
+        stored = row["forecast_data"]["daily"]
+        assert stored["temperature_2m_max"] == [28.5, 29.0, 30.2]
+        assert stored["relative_humidity_2m_max"] == [65, 71]
+        assert stored["time"] == ["2026-02-07", "2026-02-08", "2026-02-09"]
+        # The caller's copy, which goes back to the client, is untouched
+        assert forecast == _unrounded_forecast()
+
+
+class TestResolveTaluka:
+
+    def test_known_taluka(self):
+        location = weather_service.resolve_taluka("Gujarat", "Rajkot", "Jetpur")
+        assert (location["state"], location["district"], location["taluka"]) == (
+            "Gujarat", "Rajkot", "Jetpur"
+        )
+
+    def test_names_match_exactly(self):
+        assert weather_service.resolve_taluka("gujarat", "Rajkot", "Jetpur") is None
+
+    def test_unknown_taluka(self):
+        assert weather_service.resolve_taluka("Gujarat", "Rajkot", "Nowhere") is None
+
+    def test_results_are_independent_copies(self):
+        first = weather_service.resolve_taluka("Gujarat", "Rajkot", "Jetpur")
+        first["lat"] = 0.0
+        second = weather_service.resolve_taluka("Gujarat", "Rajkot", "Jetpur")
+        assert second["lat"] != 0.0
+
+    def test_location_hierarchy_is_built_once_and_read_only(self):
+        hierarchy = weather_service.get_location_hierarchy()
+        assert weather_service.get_location_hierarchy() is hierarchy
+        assert "Jetpur" in hierarchy["Gujarat"]["Rajkot"]
+        with pytest.raises(TypeError):
+            hierarchy["Gujarat"]["Rajkot"] = ()
+
+
+class TestForecastCoalescing:
+    """Concurrent cache misses for one taluka share a single upstream fetch."""
+
+    def test_cancelled_first_caller_does_not_cancel_waiters(self, monkeypatch):
+        calls = []
+
+        async def scenario():
+            release = asyncio.Event()
+
+            async def fetch_forecast(lat, lon):
+                calls.append((lat, lon))
+                await release.wait()
+                return {"daily": {}}
+
+            monkeypatch.setattr(weather_service, "fetch_forecast_from_api", fetch_forecast)
+
+            first = asyncio.create_task(
+                weather_service._fetch_forecast_coalesced("Jetpur", 21.75, 70.62)
+            )
+            await asyncio.sleep(0)
+            second = asyncio.create_task(
+                weather_service._fetch_forecast_coalesced("Jetpur", 21.75, 70.62)
+            )
+            await asyncio.sleep(0)
+
+            first.cancel()
+            await asyncio.sleep(0)
+            release.set()
+
+            result = await second
+            assert first.cancelled()
+            return result
+
+        assert asyncio.run(scenario()) == ({"daily": {}}, True)
+        assert calls == [(21.75, 70.62)]
+        assert weather_service._inflight == {}
+
+    def test_cancelled_first_caller_leaves_the_cache_write_to_a_waiter(self, monkeypatch):
+        stored = []
+        location = {
+            "lat": 21.75, "lon": 70.62,
+            "state": "Gujarat", "district": "Rajkot", "taluka": "Jetpur",
+        }
+
+        monkeypatch.setattr(weather_service, "resolve_taluka", lambda *args: location)
+        monkeypatch.setattr(weather_service, "get_cached_forecast", lambda db, taluka: None)
+        monkeypatch.setattr(
+            weather_service,
+            "store_forecast_cache",
+            lambda db, taluka, *args: stored.append((db, taluka)),
+        )
+
+        async def scenario():
+            release = asyncio.Event()
+
+            async def fetch_forecast(lat, lon):
+                await release.wait()
+                return {"daily": {}}
+
+            monkeypatch.setattr(weather_service, "fetch_forecast_from_api", fetch_forecast)
+
+            first = asyncio.create_task(
+                weather_service.get_forecast("db-1", "Gujarat", "Rajkot", "Jetpur")
+            )
+            await asyncio.sleep(0)
+            second = asyncio.create_task(
+                weather_service.get_forecast("db-2", "Gujarat", "Rajkot", "Jetpur")
+            )
+            await asyncio.sleep(0)
+
+            first.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            return await second
+
+        assert asyncio.run(scenario())["forecast"] == {"daily": {}}
+        assert stored == [("db-2", "Jetpur")]
+
+    def test_caller_that_fetched_caches_with_its_own_session(self, monkeypatch):
+        stored = []
+        location = {
+            "lat": 21.75, "lon": 70.62,
+            "state": "Gujarat", "district": "Rajkot", "taluka": "Jetpur",
+        }
+
+        async def fetch_forecast(lat, lon):
+            await asyncio.sleep(0)
+            return {"daily": {}}
+
+        monkeypatch.setattr(weather_service, "resolve_taluka", lambda *args: location)
+        monkeypatch.setattr(weather_service, "get_cached_forecast", lambda db, taluka: None)
+        monkeypatch.setattr(weather_service, "fetch_forecast_from_api", fetch_forecast)
+        monkeypatch.setattr(
+            weather_service,
+            "store_forecast_cache",
+            lambda db, taluka, *args: stored.append((db, taluka)),
+        )
+
+        async def scenario():
+            return await asyncio.gather(
+                weather_service.get_forecast("db-1", "Gujarat", "Rajkot", "Jetpur"),
+                weather_service.get_forecast("db-2", "Gujarat", "Rajkot", "Jetpur"),
+            )
+
+        results = asyncio.run(scenario())
+        assert [r["forecast"] for r in results] == [{"daily": {}}, {"daily": {}}]
+        assert stored == [("db-1", "Jetpur")]
+
+
+class TestDetermineOverallSeverity:
+
+    def test_empty(self):
+        assert weather_service.determine_overall_severity([]) == "info"
+
+    def test_order_independent(self):
+        alerts = [{"severity": "info"}, {"severity": "danger"}, {"severity": "warning"}]
+        assert weather_service.determine_overall_severity(alerts) == "danger"